@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+# Benchmark of the recursive listing of data folders (`./dds.py children`)
+#
+# Create a synthetic tree of data folders (step > tet-mesh > labeling > hex-mesh, with info.json files),
+# then compare the former level-by-level listing (one directory listing for the subfolders,
+# another one for the type, and info.json tests at each level) with walk_children(), with 1 and several threads.
+#
+# Usage (from the repository root):
+#   ./benchmarks/children_walk.py                          # ~50k folders in a temporary directory
+#   ./benchmarks/children_walk.py --folders 5000
+#   ./benchmarks/children_walk.py --tree /mnt/nfs/tree     # create the tree there if it does not exist, and keep it
+
+from argparse import ArgumentParser
+from pathlib import Path
+from statistics import median
+from tempfile import TemporaryDirectory
+from typing import Optional
+from math import ceil
+import json
+import time
+import sys
+import os
+
+REPO_ROOT: Path = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(REPO_ROOT))
+os.chdir(REPO_ROOT) # definitions/ is relative to the current working directory
+
+import dds
+
+NB_TET_MESHES: int = 4 # per step folder
+NB_LABELINGS: int = 4 # per tet-mesh folder
+NB_HEX_MESHES: int = 2 # per labeling folder
+FOLDERS_PER_MODEL: int = 1 + NB_TET_MESHES * (1 + NB_LABELINGS * (1 + NB_HEX_MESHES))
+
+def write_info_json(folder: Path, algo_name: str):
+    with open(folder / 'info.json','w') as info_json_file:
+        json.dump({
+            '2024-03-13T22:10:41Z': {
+                'GenerativeAlgorithm': algo_name,
+                'command': algo_name,
+                'parameters': dict()
+            }
+        },info_json_file)
+
+def create_tree(root: Path, nb_folders: int) -> int:
+    """
+    Create at least `nb_folders` data folders below `root`. Return the number of folders created
+    """
+    nb_models = ceil(nb_folders / FOLDERS_PER_MODEL)
+    for model_index in range(nb_models):
+        step_folder = root / f'M{model_index}'
+        step_folder.mkdir()
+        (step_folder / 'CAD.step').touch()
+        for tet_mesh_index in range(NB_TET_MESHES):
+            tet_mesh_folder = step_folder / f'Gmsh_0.{tet_mesh_index+1}'
+            tet_mesh_folder.mkdir()
+            (tet_mesh_folder / 'tet.mesh').touch()
+            write_info_json(tet_mesh_folder,'Gmsh')
+            for labeling_index in range(NB_LABELINGS):
+                labeling_folder = tet_mesh_folder / f'labeling_{labeling_index}'
+                labeling_folder.mkdir()
+                (labeling_folder / 'surface_labeling.txt').touch()
+                write_info_json(labeling_folder,'naive_labeling')
+                for hex_mesh_index in range(NB_HEX_MESHES):
+                    hex_mesh_folder = labeling_folder / f'polycube_withHexEx_{hex_mesh_index}'
+                    hex_mesh_folder.mkdir()
+                    (hex_mesh_folder / 'hex.mesh').touch()
+                    write_info_json(hex_mesh_folder,'polycube_withHexEx')
+    return nb_models * FOLDERS_PER_MODEL
+
+def legacy_list_children(path: Path) -> list[tuple[Path,Optional[str],Optional[str]]]:
+    """
+    Former recursive implementation of list_children(), for comparison
+    """
+    children = list()
+    for subfolder in dds.list_subfolders(path):
+        children.append((subfolder,dds.type_inference(subfolder),dds.get_generative_algorithm(subfolder)))
+        children.extend(legacy_list_children(subfolder))
+    return children
+
+def wall_time_ms(function, repetitions: int) -> tuple[float,int]:
+    """
+    Median wall time of a function, in milliseconds, and the length of its output
+    """
+    durations = list()
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        output = function()
+        durations.append((time.perf_counter() - start) * 1000)
+    return median(durations), len(output)
+
+def run_benchmark(root: Path, repetitions: int, nb_threads: int):
+    dds.get_definitions()
+    implementations = {
+        'level by level (former)':          lambda: legacy_list_children(root),
+        'walk_children, 1 thread':          lambda: list(dds.walk_children(root,nb_threads=1)),
+        f'walk_children, {nb_threads} threads': lambda: list(dds.walk_children(root,nb_threads=nb_threads)),
+    }
+    reference: Optional[float] = None
+    print(f"{'implementation':<30} {'folders':>8} {'time (ms)':>10} {'speedup':>8}")
+    for name, function in implementations.items():
+        duration_ms, nb_folders = wall_time_ms(function, repetitions)
+        reference = duration_ms if reference is None else reference
+        print(f"{name:<30} {nb_folders:>8} {duration_ms:>10.0f} {reference / duration_ms:>7.1f}x")
+
+if __name__ == "__main__":
+
+    parser = ArgumentParser(
+        prog='children_walk',
+        description='Benchmark of the recursive listing of data folders'
+    )
+    parser.add_argument('--folders', type=int, default=50000, help='minimal number of folders in the synthetic tree')
+    parser.add_argument('--tree', type=Path, help='where to create the synthetic tree (kept), instead of a temporary directory')
+    parser.add_argument('--repetitions', type=int, default=3, help='number of runs of each implementation')
+    parser.add_argument('--threads', type=int, default=min(32, (os.cpu_count() or 1) + 4), help='number of threads of the parallel walk')
+    args = parser.parse_args()
+
+    if args.tree is not None:
+        if not args.tree.exists():
+            args.tree.mkdir(parents=True)
+            print(f'{create_tree(args.tree.absolute(),args.folders)} folders created in {args.tree}')
+        run_benchmark(args.tree.absolute(),args.repetitions,args.threads)
+    else:
+        with TemporaryDirectory() as tmp_folder:
+            print(f'{create_tree(Path(tmp_folder),args.folders)} folders created in {tmp_folder}')
+            run_benchmark(Path(tmp_folder),args.repetitions,args.threads)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+# Startup time benchmark of dds.py
+#
+# Measure the wall time of short dds.py commands (typeof, history), minus the startup time of a bare Python interpreter,
+# print a `python -X importtime` breakdown of the modules imported by each command,
+# and report regressions against a time budget and optionally against a previous run.
+#
+# Usage (from the repository root):
+#   ./benchmarks/startup.py                          # check against the default budget
+#   ./benchmarks/startup.py --save startup.json      # also save the results
+#   ./benchmarks/startup.py --compare startup.json   # also compare with saved results
+
+from argparse import ArgumentParser
+from pathlib import Path
+from statistics import median
+from tempfile import TemporaryDirectory
+import subprocess
+import json
+import time
+import sys
+
+REPO_ROOT: Path = Path(__file__).parent.parent.absolute()
+DEFAULT_BUDGET_MS: float = 100.0 # allowed overhead over a bare interpreter, for each command
+DEFAULT_TOLERANCE: float = 0.2 # allowed relative slowdown compared to saved results
+
+def create_data_folders(root: Path) -> dict[str,Path]:
+    """
+    Create a minimal 'step' data folder, and a 'tet-mesh' subfolder with an info.json
+    """
+    step_folder = root / 'M1'
+    step_folder.mkdir()
+    (step_folder / 'CAD.step').touch()
+    tet_mesh_folder = step_folder / 'Gmsh_0.1'
+    tet_mesh_folder.mkdir()
+    (tet_mesh_folder / 'tet.mesh').touch()
+    with open(tet_mesh_folder / 'info.json','w') as info_json_file:
+        json.dump({
+            '2024-03-13T22:10:41Z': {
+                'GenerativeAlgorithm': 'Gmsh',
+                'command': 'gmsh',
+                'parameters': dict()
+            }
+        },info_json_file)
+    return {
+        'typeof': step_folder,
+        'history': tet_mesh_folder,
+    }
+
+def wall_time_ms(command: list[str], repetitions: int) -> float:
+    """
+    Median wall time of a command, in milliseconds
+    """
+    durations = list()
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        durations.append((time.perf_counter() - start) * 1000)
+    return median(durations)
+
+def importtime_breakdown(command: list[str]) -> list[tuple[str,float,float]]:
+    """
+    Top-level modules imported by a command, as (module, self time in ms, cumulative time in ms), slowest first
+    """
+    completed_process = subprocess.run([sys.executable, '-X', 'importtime'] + command[1:], cwd=REPO_ROOT, capture_output=True, text=True)
+    breakdown = list()
+    for line in completed_process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        if module.startswith('  '):
+            continue # imported by another module, already included in its cumulative time
+        breakdown.append((module.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    return sorted(breakdown, key=lambda x: x[2], reverse=True)
+
+if __name__ == "__main__":
+
+    parser = ArgumentParser(
+        prog='startup',
+        description='Startup time benchmark of dds.py'
+    )
+    parser.add_argument('--repetitions', type=int, default=10, help='number of runs of each command')
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_MS, help='allowed overhead over a bare interpreter, in ms')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='allowed relative slowdown compared to --compare results')
+    parser.add_argument('--top', type=int, default=10, help='number of modules in the import time breakdown')
+    parser.add_argument('--save', type=Path, help='JSON file in which results are written')
+    parser.add_argument('--compare', type=Path, help='JSON file of previous results')
+    args = parser.parse_args()
+
+    regressions: list[str] = list()
+    results: dict[str,float] = dict()
+
+    results['python'] = wall_time_ms([sys.executable, '-c', 'pass'], args.repetitions)
+    print(f"bare interpreter : {results['python']:.1f} ms")
+
+    with TemporaryDirectory() as tmp_folder:
+        data_folders = create_data_folders(Path(tmp_folder))
+        for action, data_folder in data_folders.items():
+            command = [sys.executable, 'dds.py', action, str(data_folder)]
+            results[action] = wall_time_ms(command, args.repetitions) - results['python']
+            print(f"\ndds.py {action} : {results[action]:.1f} ms over the bare interpreter (budget: {args.budget:.0f} ms)")
+            if results[action] > args.budget:
+                regressions.append(f"dds.py {action} exceeds the budget : {results[action]:.1f} ms > {args.budget:.0f} ms")
+            print(f"{'module':<30} {'self (ms)':>10} {'cumulative (ms)':>16}")
+            for module, self_ms, cumulative_ms in importtime_breakdown(command)[:args.top]:
+                print(f"{module:<30} {self_ms:>10.1f} {cumulative_ms:>16.1f}")
+
+    if args.compare is not None:
+        with open(args.compare) as previous_results_file:
+            previous_results = json.load(previous_results_file)
+        print()
+        for action in data_folders.keys():
+            if action not in previous_results:
+                continue
+            relative_change = (results[action] - previous_results[action]) / previous_results[action]
+            print(f"dds.py {action} : {previous_results[action]:.1f} ms -> {results[action]:.1f} ms ({relative_change:+.0%})")
+            if relative_change > args.tolerance:
+                regressions.append(f"dds.py {action} is {relative_change:.0%} slower than in {args.compare}")
+
+    if args.save is not None:
+        with open(args.save,'w') as results_file:
+            json.dump(results, results_file, indent=4)
+
+    if len(regressions) != 0:
+        print()
+        for regression in regressions:
+            print(f'REGRESSION: {regression}')
+        exit(1)
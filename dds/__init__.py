@@ -0,0 +1,3212 @@
+# Semantic data folders. Command line entry point: dds.py, see main()
+
+from __future__ import annotations # type hints are not evaluated, so they can refer to lazily imported classes
+from pathlib import Path
+import json
+import logging
+import time
+from os import mkdir, scandir, replace, getpid, environ, stat, strerror, fstat, fchmod, unlink
+from os.path import expanduser, abspath, dirname, basename, join
+import sys
+from sys import exit
+import importlib
+import importlib.util
+from types import ModuleType, SimpleNamespace
+from collections import OrderedDict, deque
+from bisect import bisect_left
+from threading import Lock # already imported by logging
+from math import floor
+
+TYPE_CHECKING = False # typing.TYPE_CHECKING, without importing typing
+if TYPE_CHECKING:
+    from typing import Optional, Iterator
+    from rich.console import Console
+    from rich.tree import Tree
+    import numpy as np
+
+# Heavy dependencies (rich, PyYAML, subprocess_tee, argparse) are imported on first use,
+# so that short commands like `typeof` or `history` start fast.
+# Inside this module, functions import what they need.
+# For the other modules (`from dds import Console`, `dds.Console`...), these names are resolved by __getattr__().
+# They are not exported by `from dds import *`, which would import them all.
+LAZY_IMPORTS: dict[str,tuple[str,Optional[str]]] = {
+    # name -> (module, attribute or None for the module itself)
+    'Optional':         ('typing','Optional'),
+    'pickle':           ('pickle',None),
+    'yaml':             ('yaml',None),
+    'subprocess_tee':   ('subprocess_tee',None),
+    'ArgumentParser':   ('argparse','ArgumentParser'),
+    'Console':          ('rich.console','Console'),
+    'group':            ('rich.console','group'),
+    'Group':            ('rich.console','Group'),
+    'Text':             ('rich.text','Text'),
+    'Rule':             ('rich.rule','Rule'),
+    'install':          ('rich.traceback','install'),
+    'RichHandler':      ('rich.logging','RichHandler'),
+    'Theme':            ('rich.theme','Theme'),
+    'Panel':            ('rich.panel','Panel'),
+    'Table':            ('rich.table','Table'),
+    'Tree':             ('rich.tree','Tree'),
+}
+
+def __getattr__(name: str):
+    # https://peps.python.org/pep-0562/
+    if name not in LAZY_IMPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    module_name, attribute = LAZY_IMPORTS[name]
+    value = importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value,attribute)
+    globals()[name] = value # next accesses will not go through __getattr__()
+    return value
+
+def print(*objects, **kwargs):
+    """
+    rich.print(), imported on first call
+    """
+    from rich import print as rich_print
+    rich_print(*objects, **kwargs)
+
+# colored and detailed Python traceback
+# https://rich.readthedocs.io/en/latest/traceback.html
+# rich.traceback is only imported when an uncaught exception occurs
+def rich_excepthook(exc_type, exc_value, exc_traceback):
+    from rich.console import Console
+    from rich.traceback import install
+    install(show_locals=True,width=Console().width,word_wrap=True) # replaces sys.excepthook
+    sys.excepthook(exc_type, exc_value, exc_traceback)
+sys.excepthook = rich_excepthook
+
+class LazyRichHandler(logging.Handler):
+    """
+    Logging handler forwarding records to a rich.logging.RichHandler, created when the first record is emitted
+    """
+    def __init__(self):
+        super().__init__()
+        self.rich_handler: Optional[logging.Handler] = None
+
+    def emit(self, record: logging.LogRecord):
+        if self.rich_handler is None:
+            from rich.logging import RichHandler
+            self.rich_handler = RichHandler()
+            self.rich_handler.setFormatter(self.formatter)
+        self.rich_handler.handle(record)
+
+# formatted and colorized Python's logging module
+# https://rich.readthedocs.io/en/latest/logging.html
+FORMAT = "%(message)s"
+logging.basicConfig(
+    level=logging.WARNING, format=FORMAT, datefmt="[%X]", handlers=[LazyRichHandler()]
+)
+log = logging.getLogger("rich")
+logging.getLogger('asyncio').setLevel(logging.WARNING) # ignore 'Using selector: EpollSelector' from asyncio selector_events.py:54
+
+def simple_human_readable_duration(duration_seconds) -> str:
+    """
+    Return a human-readable text (str) for a given duration in seconds:
+    hours, minutes & seconds elapsed
+    """
+    hours   = floor(duration_seconds // 3600)
+    minutes = floor(duration_seconds % 3600 // 60)
+    seconds = floor(duration_seconds % 60) if duration_seconds > 60 else round(duration_seconds % 60,3) # high precision only for small durations
+    formatted_duration = ''
+    if hours != 0:
+        formatted_duration += '{}h '.format(hours)
+    if minutes != 0 or hours != 0:
+        formatted_duration += '{}m '.format(minutes)
+    formatted_duration += '{}s'.format(seconds)
+    return formatted_duration
+
+def ISO_datetime_to_readable_datetime(datetime: str) -> str:
+    #ex: '2024-03-13T22:10:41Z' -> '2024-03-13 22:10:41'
+    #ex: '2024-03-13T22:10:41.123456Z' -> '2024-03-13 22:10:41.123' (see new_run_id())
+    datetime = datetime.replace('T',' ')[0:-1] # use a space separator between date and time (instead of 'T') & remove trailing 'Z'
+    if '.' in datetime:
+        datetime = datetime[0:datetime.index('.')+4] # keep milliseconds
+    return datetime
+
+_last_run_id_us: int = 0 # last value of new_run_id(), in microseconds since the Epoch
+
+def new_run_id() -> tuple[str,str]:
+    """
+    Identifier of a new run, as (key of its info.json entry, replacement of '%d' in its output folder name), from the same instant:
+    ex: ('2024-03-13T22:10:41.123456Z', '20240313_221041_123456').
+    In UTC, as told by the 'Z' suffix. Strictly increasing within a process, even if the clock goes backward. Collisions with other processes
+    are detected by the callers (existing output folder or info.json key), which then ask for a new identifier.
+    """
+    from datetime import datetime, timedelta, timezone
+    global _last_run_id_us
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    _last_run_id_us = max((datetime.now(timezone.utc) - epoch) // timedelta(microseconds=1), _last_run_id_us + 1)
+    start_datetime = epoch + timedelta(microseconds=_last_run_id_us)
+    return (
+        start_datetime.strftime('%Y-%m-%dT%H:%M:%S.%fZ'), # ISO 8601
+        start_datetime.strftime('%Y%m%d_%H%M%S_%f') # no ':' for the string to be used in a filename
+    )
+
+OLD_RUN_ID_LENGTH: int = len('2024-03-13T22:10:41Z') # former info.json keys, to the second
+
+def sort_info_entries(info_dict: dict) -> dict:
+    """
+    Entries of an info.json in chronological order of their keys, parsed as datetimes.
+    Sorting keys as strings is not chronological when old and new formats are mixed: '2024-03-13T22:10:41Z' > '2024-03-13T22:10:41.5Z'.
+    Keys which are not run identifiers are kept at the end.
+    """
+    from datetime import datetime
+    def parsed_key(key: str) -> tuple[bool,datetime,str]:
+        for key_format in ['%Y-%m-%dT%H:%M:%S.%fZ','%Y-%m-%dT%H:%M:%SZ']: # see new_run_id() and OLD_RUN_ID_LENGTH
+            try:
+                return (False, datetime.strptime(key, key_format), key)
+            except ValueError:
+                pass
+        return (True, datetime.min, key)
+    return {key: info_dict[key] for key in sorted(info_dict.keys(), key=parsed_key)}
+
+def migrate_info_files(root: Path) -> tuple[int,int]:
+    """
+    Convert the second-resolution keys of the info.json files of `root` and of the folders below it to the format of new_run_id().
+    Return the number of modified files and the number of converted keys.
+    """
+    def is_old_key(key: str) -> bool:
+        return len(key) == OLD_RUN_ID_LENGTH and key.endswith('Z')
+    def convert_key(key: str) -> str:
+        # '2024-03-13T22:10:41Z' -> '2024-03-13T22:10:41.000000Z'
+        return key[0:-1] + '.000000Z' if is_old_key(key) else key
+    nb_files, nb_keys = 0, 0
+    for folder in [root] + [subfolder for _, subfolder, _, _ in walk_children(root)]:
+        info_dict = load_info_dict(folder)
+        if info_dict is None:
+            continue
+        nb_old_keys = len([key for key in info_dict.keys() if is_old_key(key)])
+        if nb_old_keys == 0:
+            continue
+        # rewrite info.json with the converted keys (and the journal entries), as concurrent writers would expect
+        compact_info_journal(folder, blocking=True, key_conversion=convert_key)
+        nb_files += 1
+        nb_keys += nb_old_keys
+    return nb_files, nb_keys
+
+def collapseuser(path: Path) -> str:
+    # inverse of os.path.expanduser()
+    # thanks commandlineluser https://www.reddit.com/r/learnpython/comments/4mmkjo/whats_the_opposite_of_ospathexpanduser/
+    return str(path.absolute()).replace(
+        expanduser('~'),
+        '~',
+        1 # only replace the fist occurrence
+    )
+
+def get_YAML_loader():
+    """
+    C implementation of the YAML loader (LibYAML bindings) if available, else the pure Python one
+    """
+    import yaml
+    return getattr(yaml,'CSafeLoader',yaml.SafeLoader)
+
+DEFINITIONS_CACHE_FILE: Path = Path('.cache/definitions.pickle')
+DEFINITIONS_CACHE_VERSION: int = 8 # to increment when the content of DefinitionsRegistry changes
+
+ALGORITHM_RESERVED_KEYS: list[str] = ['description','hooks','logs','timeout','debug_files'] # top-level keys of <algo>.yml that are not input data folder types
+HOOK_STAGES: list[str] = ['pre','post'] # <algo>.pre.py and <algo>.post.py
+RESOURCE_KEYS: list[str] = ['threads','memory_gb','exclusive','group','group_limit'] # keys of the 'resources' entry of an input data folder type in <algo>.yml, see RunResources
+
+class DefinitionsRegistry():
+    """
+    Content of definitions/ (data folder types, their views, algorithms and paths.yml),
+    parsed and validated once, then indexed for in-memory lookups.
+    Use get_definitions() to access the process-wide instance.
+    """
+
+    def __init__(self, definitions_folder: Path = Path('definitions')):
+        self.definitions_folder: Path = definitions_folder
+        # raw content of the YAML files
+        self.data_folder_types: dict[str,dict] = dict() # data folder type -> content of <type>.yml
+        self.views: dict[str,dict[str,dict]] = dict() # data folder type -> view name -> content of <type>.<view>.yml
+        self.algorithms: dict[str,dict] = dict() # algorithm name -> content of <algo>.yml
+        self.algorithms_as_Python_script: list[str] = list() # names of the algorithms defined as <algo>.py
+        self.hook_scripts: dict[str,dict[str,Path]] = dict() # algorithm name -> stage -> <algo>.<stage>.py found in definitions/algorithms/
+        self.paths: dict[str,str] = dict() # content of paths.yml
+        # indices, see build_indices()
+        self.filename_keywords: dict[str,tuple[str,str]] = dict() # filename keyword -> (filename, data folder type)
+        self.distinctive_filenames: dict[str,list[str]] = dict() # data folder type -> filenames whose existence determines the type
+        self.types_of_distinctive_filename: dict[str,list[str]] = dict() # reverse map: distinctive filename -> data folder types
+        self.algorithm_specs: dict[str,dict[str,dict]] = dict() # algorithm name -> input data folder type -> behavior of the algorithm
+        self.hooks: dict[str,dict[str,Path]] = dict() # algorithm name -> stage -> script to execute
+        self.producers: dict[str,dict[str,list[str]]] = dict() # data folder type -> filename keyword -> transformative non-parametric algorithms writing this file
+        self.parse()
+        self.validate()
+        self.build_indices()
+
+    def parse(self):
+        import yaml
+        YAML_LOADER = get_YAML_loader()
+        data_folder_types_folder: Path = self.definitions_folder / 'data_folder_types'
+        for YAML_filepath in sorted(data_folder_types_folder.iterdir()):
+            if not YAML_filepath.is_file() or YAML_filepath.suffix != '.yml':
+                continue
+            with open(YAML_filepath) as YAML_stream:
+                YAML_content = yaml.load(YAML_stream, Loader=YAML_LOADER)
+            if YAML_filepath.stem.count('.') == 0:
+                self.data_folder_types[YAML_filepath.stem] = YAML_content
+            else:
+                # <data_folder_type>.<view_name>.yml
+                data_folder_type, view_name = YAML_filepath.stem.split('.',1)
+                self.views.setdefault(data_folder_type,dict())[view_name] = YAML_content
+        algorithms_folder: Path = self.definitions_folder / 'algorithms'
+        for filepath in sorted(algorithms_folder.iterdir()):
+            if not filepath.is_file():
+                continue
+            if filepath.suffix == '.yml':
+                with open(filepath) as YAML_stream:
+                    self.algorithms[filepath.stem] = yaml.load(YAML_stream, Loader=YAML_LOADER)
+            elif filepath.suffix == '.py' and filepath.stem.count('.') == 0:
+                self.algorithms_as_Python_script.append(filepath.stem)
+            elif filepath.suffix == '.py' and filepath.stem.count('.') == 1 and filepath.stem.split('.')[1] in HOOK_STAGES:
+                # <algo>.pre.py or <algo>.post.py
+                algo_name, stage = filepath.stem.split('.')
+                self.hook_scripts.setdefault(algo_name,dict())[stage] = filepath
+        with open(self.definitions_folder / 'paths.yml') as paths_stream:
+            self.paths = yaml.load(paths_stream, Loader=YAML_LOADER)
+
+    def validate(self):
+        """
+        Structure checks of all definitions, so that lookups do not have to do them
+        """
+        for data_folder_type, YAML_content in self.data_folder_types.items():
+            YAML_filepath: Path = self.definitions_folder / 'data_folder_types' / (data_folder_type + '.yml')
+            if 'filenames' not in YAML_content:
+                log.error(f"{YAML_filepath} has no 'filenames' entry")
+                exit(1)
+            if 'distinctive_content' not in YAML_content:
+                log.error(f"{YAML_filepath} has no 'distinctive_content' entry")
+                exit(1)
+            for distinctive_content in YAML_content['distinctive_content']:
+                if distinctive_content not in YAML_content['filenames']:
+                    log.error(f"{YAML_filepath} has no 'filenames'/'{distinctive_content}' entry, despite being referenced in the 'distinctive_content' entry")
+                    exit(1)
+            if 'default_view' in YAML_content and YAML_content['default_view'] not in self.views.get(data_folder_type,dict()):
+                log.fatal(f"Default view of data folder type '{data_folder_type}' is '{YAML_content['default_view']}', but there is no {data_folder_type}.{YAML_content['default_view']}.yml in definitions/data_folder_types/")
+                exit(1)
+        for data_folder_type, views in self.views.items():
+            if data_folder_type not in self.data_folder_types:
+                log.error(f"There are views for data folder type '{data_folder_type}', but there is no {data_folder_type}.yml in definitions/data_folder_types/")
+                exit(1)
+            for view_name, YAML_content in views.items():
+                YAML_filepath: Path = self.definitions_folder / 'data_folder_types' / f'{data_folder_type}.{view_name}.yml'
+                self.validate_executable_and_arguments(YAML_filepath, data_folder_type, YAML_content, is_view=True)
+        for algo_name, YAML_content in self.algorithms.items():
+            YAML_filepath: Path = self.definitions_folder / 'algorithms' / (algo_name + '.yml')
+            if 'hooks' in YAML_content:
+                # declared pre/post-processing stages, the filesystem is not checked for the others
+                if not isinstance(YAML_content['hooks'],list) or any([stage not in HOOK_STAGES for stage in YAML_content['hooks']]):
+                    log.error(f"In {YAML_filepath}, 'hooks' must be a list of stages among {HOOK_STAGES}")
+                    exit(1)
+                for stage in YAML_content['hooks']:
+                    if stage not in self.hook_scripts.get(algo_name,dict()):
+                        log.error(f"{YAML_filepath} declares a '{stage}' hook, but {algo_name}.{stage}.py does not exist")
+                        exit(1)
+                for stage in self.hook_scripts.get(algo_name,dict()):
+                    if stage not in YAML_content['hooks']:
+                        log.warning(f"{algo_name}.{stage}.py will be ignored because {YAML_filepath} does not declare it in 'hooks'")
+            if 'timeout' in YAML_content and (not isinstance(YAML_content['timeout'],(int,float)) or isinstance(YAML_content['timeout'],bool) or YAML_content['timeout'] <= 0):
+                log.error(f"In {YAML_filepath}, 'timeout' must be a positive number of seconds")
+                exit(1)
+            if 'debug_files' in YAML_content:
+                if not isinstance(YAML_content['debug_files'],dict) or any([key not in ['patterns','prefix'] for key in YAML_content['debug_files']]):
+                    log.error(f"In {YAML_filepath}, 'debug_files' must be a dict with keys among ['patterns','prefix']")
+                    exit(1)
+                if not isinstance(YAML_content['debug_files'].get('patterns',None),list) or any([not isinstance(pattern,str) for pattern in YAML_content['debug_files']['patterns']]):
+                    log.error(f"In {YAML_filepath}, 'debug_files/patterns' must be a list of glob patterns")
+                    exit(1)
+                if 'prefix' in YAML_content['debug_files'] and not isinstance(YAML_content['debug_files']['prefix'],str):
+                    log.error(f"In {YAML_filepath}, 'debug_files/prefix' must be a string")
+                    exit(1)
+                # whether to keep them is given by the 'keep_debug_files' argument
+                for input_folder_type in [key for key in YAML_content if key not in ALGORITHM_RESERVED_KEYS]:
+                    keep_debug_files = YAML_content[input_folder_type].get('arguments',dict()).get('others',dict()).get('keep_debug_files',dict())
+                    if not isinstance(keep_debug_files.get('default',None),bool):
+                        log.error(f"{YAML_filepath} declares 'debug_files', but '{input_folder_type}/arguments/others' has no 'keep_debug_files' argument with a true/false default value")
+                        exit(1)
+            if 'logs' in YAML_content:
+                if not isinstance(YAML_content['logs'],dict) or any([key not in LOG_SETTINGS for key in YAML_content['logs']]):
+                    log.error(f"In {YAML_filepath}, 'logs' must be a dict with keys among {LOG_SETTINGS}")
+                    exit(1)
+                if 'max_size' in YAML_content['logs'] and (not isinstance(YAML_content['logs']['max_size'],int) or YAML_content['logs']['max_size'] <= 0):
+                    log.error(f"In {YAML_filepath}, 'logs/max_size' must be a positive number of bytes")
+                    exit(1)
+                if 'gzip' in YAML_content['logs'] and not isinstance(YAML_content['logs']['gzip'],bool):
+                    log.error(f"In {YAML_filepath}, 'logs/gzip' must be true or false")
+                    exit(1)
+            for input_folder_type in [key for key in YAML_content if key not in ALGORITHM_RESERVED_KEYS]:
+                if input_folder_type not in self.data_folder_types:
+                    log.error(f"{YAML_filepath} specifies a behavior for input data folders of type '{input_folder_type}', but this type is not declared in definitions/data_folder_types/")
+                    exit(1)
+                self.validate_executable_and_arguments(YAML_filepath, input_folder_type, YAML_content[input_folder_type], is_view=False)
+                self.validate_resources(YAML_filepath, input_folder_type, YAML_content[input_folder_type])
+
+    def validate_executable_and_arguments(self, YAML_filepath: Path, data_folder_type: str, YAML_content: dict, is_view: bool):
+        """
+        Checks shared by views (<type>.<view>.yml) and algorithms (per input data folder type of <algo>.yml)
+        """
+        if 'executable' not in YAML_content:
+            log.error(f"{YAML_filepath} has no '{data_folder_type}/executable' entry")
+            exit(1)
+        if 'path' not in YAML_content['executable']:
+            log.error(f"{YAML_filepath} has no '{data_folder_type}/executable/path' entry")
+            exit(1)
+        if 'command_line' not in YAML_content['executable']:
+            log.error(f"{YAML_filepath} has no '{data_folder_type}/executable/command_line' entry")
+            exit(1)
+        if 'arguments' not in YAML_content:
+            log.error(f"{YAML_filepath} has no '{data_folder_type}/arguments' entry")
+            exit(1)
+        if 'input_files' not in YAML_content['arguments']:
+            log.error(f"{YAML_filepath} has no '{data_folder_type}/arguments/input_files' entry")
+            exit(1)
+        if not is_view and 'output_folder' not in YAML_content and 'output_files' not in YAML_content['arguments']:
+            log.fatal(f"{YAML_filepath} has no '{data_folder_type}/arguments/output_files' entry")
+            exit(1)
+        all_arguments = set()
+        for kind_of_arguments in ['input_files','output_files','others']:
+            for argument in YAML_content['arguments'].get(kind_of_arguments,dict()):
+                if argument in all_arguments:
+                    log.error(f"{YAML_filepath} has multiple arguments named '{argument}' in '{data_folder_type}/arguments")
+                    exit(1)
+                all_arguments.add(argument)
+                if kind_of_arguments == 'others':
+                    if 'adjacent_file' in YAML_content['arguments']['others'][argument]:
+                        continue
+                    if is_view:
+                        log.fatal(f"'{argument} in '{YAML_filepath} /arguments/others has no 'adjacent_file' field")
+                        exit(1)
+                    if 'default' not in YAML_content['arguments']['others'][argument]:
+                        log.fatal(f"'{argument} in '{YAML_filepath} {data_folder_type}/arguments/others has neither a 'default' nor a 'adjacent_file' field")
+                        exit(1)
+                elif not any([YAML_content['arguments'][kind_of_arguments][argument] in type_content['filenames'] for type_content in self.data_folder_types.values()]):
+                    log.error(f"None of the data folder types declare the '{YAML_content['arguments'][kind_of_arguments][argument]}' filename keyword, referenced in {YAML_filepath} at '{data_folder_type}/arguments/{kind_of_arguments}/{argument}'")
+                    exit(1)
+
+    def validate_resources(self, YAML_filepath: Path, data_folder_type: str, YAML_content: dict):
+        """
+        Checks of the optional 'resources' entry, for an input data folder type of <algo>.yml
+        """
+        import string
+        if 'resources' not in YAML_content:
+            return
+        resources: dict = YAML_content['resources']
+        if not isinstance(resources,dict) or any([key not in RESOURCE_KEYS for key in resources]):
+            log.error(f"In {YAML_filepath}, '{data_folder_type}/resources' must be a dict with keys among {RESOURCE_KEYS}")
+            exit(1)
+        if 'threads' in resources:
+            if isinstance(resources['threads'],str):
+                # template like '{nb_threads}', whose fields must be 'others' arguments with a default value
+                for _, field_name, _, _ in string.Formatter().parse(resources['threads']):
+                    if field_name is not None and 'default' not in YAML_content['arguments'].get('others',dict()).get(field_name,dict()):
+                        log.error(f"In {YAML_filepath}, '{data_folder_type}/resources/threads' references '{field_name}', which is not an argument with a default value")
+                        exit(1)
+            elif not isinstance(resources['threads'],int) or isinstance(resources['threads'],bool) or resources['threads'] <= 0:
+                log.error(f"In {YAML_filepath}, '{data_folder_type}/resources/threads' must be a positive number or a template like '{{nb_threads}}'")
+                exit(1)
+        if 'memory_gb' in resources and (not isinstance(resources['memory_gb'],(int,float)) or isinstance(resources['memory_gb'],bool) or resources['memory_gb'] < 0):
+            log.error(f"In {YAML_filepath}, '{data_folder_type}/resources/memory_gb' must be a positive number")
+            exit(1)
+        if 'exclusive' in resources and not isinstance(resources['exclusive'],bool):
+            log.error(f"In {YAML_filepath}, '{data_folder_type}/resources/exclusive' must be true or false")
+            exit(1)
+        if 'group' in resources and not isinstance(resources['group'],str):
+            log.error(f"In {YAML_filepath}, '{data_folder_type}/resources/group' must be a string")
+            exit(1)
+        if 'group_limit' in resources:
+            if 'group' not in resources:
+                log.error(f"In {YAML_filepath}, '{data_folder_type}/resources/group_limit' is given without 'group'")
+                exit(1)
+            if not isinstance(resources['group_limit'],int) or isinstance(resources['group_limit'],bool) or resources['group_limit'] <= 0:
+                log.error(f"In {YAML_filepath}, '{data_folder_type}/resources/group_limit' must be a positive number")
+                exit(1)
+
+    def build_indices(self):
+        for data_folder_type, YAML_content in self.data_folder_types.items():
+            for filename_keyword, filename in YAML_content['filenames'].items():
+                if filename_keyword not in self.filename_keywords: # first declaration wins
+                    self.filename_keywords[filename_keyword] = (filename,data_folder_type)
+            self.distinctive_filenames[data_folder_type] = [YAML_content['filenames'][x] for x in YAML_content['distinctive_content']]
+            for filename in self.distinctive_filenames[data_folder_type]:
+                self.types_of_distinctive_filename.setdefault(filename,list()).append(data_folder_type)
+        for algo_name, YAML_content in self.algorithms.items():
+            self.algorithm_specs[algo_name] = { key: value for key, value in YAML_content.items() if key not in ALGORITHM_RESERVED_KEYS }
+            self.hooks[algo_name] = { stage: filepath for stage, filepath in self.hook_scripts.get(algo_name,dict()).items() if 'hooks' not in YAML_content or stage in YAML_content['hooks'] }
+            for input_folder_type, algo_spec in self.algorithm_specs[algo_name].items():
+                if 'output_folder' in algo_spec or 'others' in algo_spec['arguments']:
+                    continue # generative or parametric algorithm, cannot be used to auto-generate a missing file
+                for output_filename_keyword in algo_spec['arguments'].get('output_files',dict()).values():
+                    self.producers.setdefault(input_folder_type,dict()).setdefault(output_filename_keyword,list()).append(algo_name)
+
+def get_definitions_fingerprint(definitions_folder: Path = Path('definitions')) -> list[tuple[str,int,int]]:
+    """
+    (filepath, modification time in ns, size) of each file the DefinitionsRegistry depends on.
+    Adding, removing or editing a definition changes the fingerprint.
+    """
+    fingerprint = list()
+    for subfolder in ['data_folder_types','algorithms']:
+        with scandir(definitions_folder / subfolder) as it:
+            for entry in it:
+                if entry.is_file():
+                    stat = entry.stat()
+                    fingerprint.append((entry.path,stat.st_mtime_ns,stat.st_size))
+    stat = (definitions_folder / 'paths.yml').stat()
+    fingerprint.append((str(definitions_folder / 'paths.yml'),stat.st_mtime_ns,stat.st_size))
+    return sorted(fingerprint)
+
+def load_definitions_cache(fingerprint: list[tuple[str,int,int]]) -> Optional[DefinitionsRegistry]:
+    """
+    Return the DefinitionsRegistry stored in DEFINITIONS_CACHE_FILE, or None if missing, unreadable or stale
+    """
+    import pickle
+    try:
+        with open(DEFINITIONS_CACHE_FILE,'rb') as cache_stream:
+            cache_content = pickle.load(cache_stream)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(cache_content,dict) or cache_content.get('version') != DEFINITIONS_CACHE_VERSION or cache_content.get('fingerprint') != fingerprint:
+        return None
+    # attributes are stored instead of the object itself, so that the cache does not depend on where the class is defined
+    definitions = DefinitionsRegistry.__new__(DefinitionsRegistry)
+    definitions.__dict__.update(cache_content['registry'])
+    return definitions
+
+def write_definitions_cache(definitions: DefinitionsRegistry, fingerprint: list[tuple[str,int,int]]):
+    import pickle
+    try:
+        DEFINITIONS_CACHE_FILE.parent.mkdir(exist_ok=True)
+        # write to a temporary file then rename, so that concurrent processes never read a partial cache
+        tmp_filepath = DEFINITIONS_CACHE_FILE.with_suffix(f'.{getpid()}.tmp')
+        with open(tmp_filepath,'wb') as cache_stream:
+            pickle.dump({
+                'version': DEFINITIONS_CACHE_VERSION,
+                'fingerprint': fingerprint,
+                'registry': definitions.__dict__
+            },cache_stream,protocol=pickle.HIGHEST_PROTOCOL)
+        replace(tmp_filepath,DEFINITIONS_CACHE_FILE)
+    except OSError as e:
+        log.debug(f'Cannot write {DEFINITIONS_CACHE_FILE} : {e}')
+
+_definitions: Optional[DefinitionsRegistry] = None # process-wide instance, see get_definitions()
+
+def get_definitions() -> DefinitionsRegistry:
+    """
+    Return the process-wide DefinitionsRegistry.
+    On first call, load it from DEFINITIONS_CACHE_FILE if up to date, else parse definitions/ and update the cache
+    """
+    global _definitions
+    if _definitions is None:
+        fingerprint = get_definitions_fingerprint()
+        _definitions = load_definitions_cache(fingerprint)
+        if _definitions is None:
+            _definitions = DefinitionsRegistry()
+            write_definitions_cache(_definitions,fingerprint)
+    return _definitions
+
+def rebuild_definitions_cache() -> DefinitionsRegistry:
+    """
+    Parse definitions/ regardless of the cache, and overwrite the cache
+    """
+    global _definitions
+    fingerprint = get_definitions_fingerprint()
+    _definitions = DefinitionsRegistry()
+    write_definitions_cache(_definitions,fingerprint)
+    return _definitions
+
+def print_definitions_cache_stats():
+    import yaml
+    from rich.console import Console
+    from rich.table import Table
+    YAML_LOADER = get_YAML_loader()
+    table = Table()
+    table.add_column('Property')
+    table.add_column('Value')
+    fingerprint = get_definitions_fingerprint()
+    table.add_row('Cache file',collapseuser(DEFINITIONS_CACHE_FILE))
+    if DEFINITIONS_CACHE_FILE.exists():
+        stat = DEFINITIONS_CACHE_FILE.stat()
+        table.add_row('Size',f'{stat.st_size/1024:.1f} KiB')
+        table.add_row('Last rebuild',time.strftime('%Y-%m-%d %H:%M:%S',time.localtime(stat.st_mtime)))
+        table.add_row('Up to date',str(load_definitions_cache(fingerprint) is not None))
+    else:
+        table.add_row('Size','[bright_black]no cache file[/]')
+    table.add_row('Tracked files',str(len(fingerprint)))
+    table.add_row('YAML loader',YAML_LOADER.__name__ + (' (LibYAML)' if YAML_LOADER is not yaml.SafeLoader else ' (pure Python)'))
+    definitions = get_definitions()
+    table.add_row('Data folder types',str(len(definitions.data_folder_types)))
+    table.add_row('Views',str(sum([len(views) for views in definitions.views.values()])))
+    table.add_row('Algorithms (YAML)',str(len(definitions.algorithms)))
+    table.add_row('Algorithms (Python script)',str(len(definitions.algorithms_as_Python_script)))
+    table.add_row('Path keywords',str(len(definitions.paths)))
+    console = Console()
+    console.print(table)
+
+def translate_filename_keyword(filename_keyword: str) -> tuple[str,str]:
+    """
+    From a filename keyword (by convention in uppercase), find the data folder type that define this filename keyword.
+    Return the associated filename, and the datafolder type
+    """
+    definitions = get_definitions()
+    if filename_keyword not in definitions.filename_keywords:
+        log.error(f"None of the data folder types declare the '{filename_keyword}' filename keyword")
+        exit(1)
+    return definitions.filename_keywords[filename_keyword]
+
+class InvalidPathKeywordError(Exception):
+    """
+    Exception raised when a path keyword does not exist in definitions/paths.yml
+    """
+    def __init__(self, path_keyword):
+        super().__init__(f"Path '{path_keyword}' is referenced but does not exist in definitions/paths.yml")
+
+def translate_path_keyword(path_keyword: str) -> Optional[Path]:
+    paths = get_definitions().paths
+    if path_keyword not in paths:
+        raise InvalidPathKeywordError(path_keyword)
+    return Path(paths[path_keyword])
+
+def get_declared_data_folder_types() -> list[str]:
+    return list(get_definitions().data_folder_types.keys()) # already sorted
+# TODO use a custom key for sorted() like lambda x: str.casefold(str(x)
+
+def get_default_view_name(data_folder_type: str) -> Optional[str]:
+    definitions = get_definitions()
+    if data_folder_type not in definitions.data_folder_types:
+        log.fatal(f'{definitions.definitions_folder}/data_folder_types/{data_folder_type}.yml does not exist')
+        exit(1)
+    return definitions.data_folder_types[data_folder_type].get('default_view',None) # existence of the view checked by DefinitionsRegistry.validate()
+
+def get_declared_views(data_folder_type: str) -> list[str]:
+    """
+    Find all <data_folder_type>.*.yml in definitions/data_folder_types/
+    """
+    return list(get_definitions().views.get(data_folder_type,dict()).keys())
+
+def get_declared_algorithms_as_YAML() -> list[str]:
+    return list(get_definitions().algorithms.keys()) # already sorted
+# TODO use a custom key for sorted() like lambda x: str.casefold(str(x)
+
+def get_declared_algorithms_as_Python_script() -> list[str]:
+    return get_definitions().algorithms_as_Python_script # already sorted
+# TODO use a custom key for sorted() like lambda x: str.casefold(str(x)
+
+def is_instance_of(path: Path, data_folder_type: str) -> bool:
+    definitions = get_definitions()
+    if data_folder_type not in definitions.distinctive_filenames:
+        log.error(f'{definitions.definitions_folder}/data_folder_types/{data_folder_type}.yml does not exist')
+        exit(1)
+    for filename in definitions.distinctive_filenames[data_folder_type]:
+        if (path / filename).exists():
+            return True # at least one of the distinctive content exist
+    return False
+
+def type_inference_from_filenames(path: Path | str, filenames) -> Optional[str]:
+    """
+    Infer the type of the folder `path` from the names of its content
+    """
+    types_of_distinctive_filename = get_definitions().types_of_distinctive_filename
+    recognized_types = set()
+    for filename in types_of_distinctive_filename.keys() & set(filenames):
+        recognized_types.update(types_of_distinctive_filename[filename])
+    if len(recognized_types) == 0:
+        return None
+    if len(recognized_types) > 1:
+        log.error(f"Several data folder types recognize the folder {path}")
+        exit(1)
+    return recognized_types.pop()
+
+def type_inference(path: Path) -> Optional[str]:
+    # a single directory listing instead of testing the existence of each distinctive filename
+    try:
+        with scandir(path) as it:
+            return type_inference_from_filenames(path,[entry.name for entry in it])
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return None
+
+def type_inference_batch(paths: list[Path]) -> list[Optional[str]]:
+    """
+    Infer the type of several folders, in one pass. Same order as `paths`.
+    Paths are grouped by parent folder, and each parent is listed once, so that missing paths and files are skipped
+    without a system call each. Then each folder is listed once. None for paths that are not readable folders
+    """
+    indices_per_parent: dict[str,list[int]] = dict()
+    for index, path in enumerate(paths):
+        indices_per_parent.setdefault(dirname(abspath(path)),list()).append(index)
+    types: list[Optional[str]] = [None] * len(paths)
+    for parent, indices in indices_per_parent.items():
+        try:
+            with scandir(parent) as it:
+                subfolders: set[str] = {entry.name for entry in it if entry.is_dir()}
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        for index in indices:
+            if basename(abspath(paths[index])) not in subfolders:
+                continue
+            try:
+                with scandir(paths[index]) as it:
+                    types[index] = type_inference_from_filenames(paths[index],[entry.name for entry in it])
+            except (FileNotFoundError, NotADirectoryError, PermissionError): # removed since the listing of the parent, or not readable
+                pass
+    return types
+
+def list_subfolders(path: Path) -> list[Path]:
+    """
+    Sorted subfolders of `path`, from a single directory listing
+    """
+    with scandir(path) as it:
+        return sorted([Path(entry.path) for entry in it if entry.is_dir()])
+
+INFO_JOURNAL_FILENAME: str = 'info.journal.jsonl' # next to info.json, see append_info_entry()
+
+# Concurrent writers of info.json
+# DataFolder.run() does not rewrite info.json: it appends its entry, as one JSON line, to a per-folder journal, under an exclusive fcntl lock.
+# Readers take a shared lock on the journal while reading info.json (the snapshot) and the journal, and merge them.
+# Compaction merges the journal into info.json (atomic replace) and removes the journal, under an exclusive lock.
+# It is idempotent: entries are keyed by run identifiers, so an entry present in both files is read once.
+# A writer or a compaction waiting for the lock may obtain it on a journal that was removed in the meantime, see open_locked_journal().
+
+def read_journal(journal_file) -> dict:
+    """
+    Entries of an opened journal, skipping unparsable lines (left by an interrupted writer)
+    """
+    entries = dict()
+    journal_file.seek(0)
+    for line in journal_file:
+        if line.strip() == '':
+            continue
+        try:
+            entries.update(json.loads(line))
+        except json.JSONDecodeError:
+            log.warning(f'Ignoring an invalid line in {journal_file.name}')
+    return entries
+
+def read_info_dict(path: Path) -> Optional[dict]:
+    """
+    Content of info.json merged with its journal, or None if there is none. Not cached, see load_info_dict()
+    """
+    import fcntl
+    try:
+        journal_file = open(path / INFO_JOURNAL_FILENAME)
+    except FileNotFoundError:
+        journal_file = None
+    try:
+        if journal_file is not None:
+            fcntl.flock(journal_file, fcntl.LOCK_SH)
+        info_dict: Optional[dict] = None
+        if (path / 'info.json').exists():
+            with open(path / 'info.json') as info_json_file:
+                info_dict = json.load(info_json_file)
+        if journal_file is not None:
+            journal_entries = read_journal(journal_file)
+            if len(journal_entries) != 0:
+                info_dict = sort_info_entries({**(info_dict or dict()), **journal_entries}) # journal entries from concurrent processes may be out of order
+        return info_dict
+    finally:
+        if journal_file is not None:
+            journal_file.close() # releases the lock
+
+def open_locked_journal(path: Path, create: bool, lock: int):
+    """
+    Open the journal of the folder `path` and lock it (`lock` being fcntl.LOCK_SH, LOCK_EX...).
+    Retry if the journal was removed by a compaction while waiting for the lock. Return None if there is no journal and not `create`.
+    Raise BlockingIOError if `lock` is non-blocking and the journal is locked.
+    """
+    import fcntl
+    while True:
+        try:
+            journal_file = open(path / INFO_JOURNAL_FILENAME, 'a+' if create else 'r+')
+        except FileNotFoundError:
+            return None
+        try:
+            fcntl.flock(journal_file, lock)
+            if fstat(journal_file.fileno()).st_ino == stat(path / INFO_JOURNAL_FILENAME).st_ino:
+                return journal_file
+        except FileNotFoundError: # removed by a compaction
+            pass
+        except BlockingIOError:
+            journal_file.close()
+            raise
+        journal_file.close()
+
+def append_info_entry(path: Path, key: str, entry: dict) -> str:
+    """
+    Append an entry to the info.json journal of the folder `path`. If `key` is already used, a new run identifier is used instead.
+    Return the key of the entry. A compaction is started in the background.
+    """
+    import fcntl
+    with open_locked_journal(path, True, fcntl.LOCK_EX) as journal_file:
+        existing_keys = set(read_journal(journal_file).keys())
+        if (path / 'info.json').exists():
+            with open(path / 'info.json') as info_json_file:
+                existing_keys.update(json.load(info_json_file).keys())
+        while key in existing_keys:
+            # there is already a key with this identifier (written by another process) -> get a new one
+            key, _ = new_run_id()
+        journal_file.write(json.dumps({key: entry}, sort_keys=True) + '\n') # 'a' mode: at the end of the file
+        journal_file.flush()
+    forget_info_dict(path)
+    start_info_journal_compaction(path)
+    return key
+
+def compact_info_journal(path: Path, blocking: bool = False, key_conversion = None) -> bool:
+    """
+    Merge the journal of the folder `path` into its info.json, and remove the journal.
+    If not `blocking`, give up when the journal is locked by another reader/writer.
+    `key_conversion`, if given, is applied to all keys (see migrate_info_files()). Return True if info.json was rewritten.
+    """
+    import fcntl
+    from tempfile import mkstemp
+    try:
+        journal_file = open_locked_journal(path, False, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    if journal_file is None:
+        if key_conversion is None:
+            return False
+        journal_file = open_locked_journal(path, True, fcntl.LOCK_EX) # to exclude writers during the conversion
+    with journal_file:
+        journal_entries = read_journal(journal_file)
+        if len(journal_entries) == 0 and key_conversion is None:
+            journal_file.truncate(0)
+            unlink(path / INFO_JOURNAL_FILENAME)
+            return False
+        info_dict = dict()
+        if (path / 'info.json').exists():
+            with open(path / 'info.json') as info_json_file:
+                info_dict = json.load(info_json_file)
+        info_dict.update(journal_entries)
+        if key_conversion is not None:
+            converted_info_dict = {key_conversion(key): value for key, value in info_dict.items()}
+            if converted_info_dict == info_dict and len(journal_entries) == 0:
+                unlink(path / INFO_JOURNAL_FILENAME)
+                return False
+            info_dict = converted_info_dict
+        # temporary file with a unique name, in case another process compacts the same folder
+        tmp_fd, tmp_filepath = mkstemp(dir=path, prefix='info.json.', suffix='.tmp')
+        try:
+            with open(tmp_fd,'w') as file:
+                fchmod(file.fileno(), stat(path / 'info.json').st_mode & 0o777 if (path / 'info.json').exists() else 0o644) # mkstemp() creates it with 0o600
+                json.dump(sort_info_entries(info_dict), file, indent=4) # not sort_keys, see sort_info_entries()
+            replace(tmp_filepath, path / 'info.json') # atomic
+        except BaseException:
+            unlink(tmp_filepath)
+            raise
+        journal_file.truncate(0) # for readers which opened it before the removal
+        unlink(path / INFO_JOURNAL_FILENAME) # while locked, see open_locked_journal()
+    forget_info_dict(path)
+    return True
+
+_pending_compactions: set[str] = set() # absolute paths of the folders queued for compaction, see start_info_journal_compaction()
+_pending_compactions_lock: Lock = Lock()
+_compaction_queue = None # queue.SimpleQueue of folders, created with the worker thread
+
+def start_info_journal_compaction(path: Path):
+    """
+    Queue the compaction of the journal of `path`, done by a single background thread.
+    A folder already queued is not queued again. The thread is a daemon: the process does not wait for it before exiting,
+    a journal left behind is merged by the readers, and compacted after the next append (or by `dds.py migrate`).
+    """
+    import threading
+    import queue
+    global _compaction_queue
+    key = abspath(path)
+    with _pending_compactions_lock:
+        if key in _pending_compactions:
+            return
+        _pending_compactions.add(key)
+        if _compaction_queue is None:
+            _compaction_queue = queue.SimpleQueue()
+            threading.Thread(target=info_journal_compaction_worker, name='info.json journal compaction', daemon=True).start()
+    _compaction_queue.put(path)
+
+def info_journal_compaction_worker():
+    while True:
+        path = _compaction_queue.get()
+        with _pending_compactions_lock:
+            _pending_compactions.discard(abspath(path)) # an append during the compaction queues it again
+        try:
+            compact_info_journal(path, False)
+        except (OSError, json.JSONDecodeError) as e:
+            log.warning(f'Cannot compact {path / INFO_JOURNAL_FILENAME} : {e}')
+
+class SortedPaths():
+    """
+    Sorted list of absolute paths (as str), the keys of a cache, to find a folder and the folders below by bisection
+    instead of comparing all the keys, see notify_folder_modified()
+    """
+
+    __slots__ = ('paths',)
+
+    def __init__(self):
+        self.paths: list[str] = list()
+
+    def add(self, path: str):
+        index = bisect_left(self.paths, path)
+        if index == len(self.paths) or self.paths[index] != path:
+            self.paths.insert(index, path)
+
+    def discard(self, path: str):
+        index = bisect_left(self.paths, path)
+        if index < len(self.paths) and self.paths[index] == path:
+            del self.paths[index]
+
+    def pop_subtree(self, path: str) -> list[str]:
+        """
+        Remove and return `path` and the paths below it
+        """
+        # the paths below are contiguous: they start with path + '/', and are before path + '0' ('0' follows '/')
+        start = bisect_left(self.paths, path + '/')
+        stop = bisect_left(self.paths, path + '0', start)
+        subtree = self.paths[start:stop]
+        del self.paths[start:stop]
+        self.discard(path) # not in [start,stop[ : path < path + '-' < path + '/'
+        return subtree + [path]
+
+INFO_CACHE_SIZE: int = 65536 # maximal number of parsed info.json kept by load_info_dict()
+
+_info_dicts: OrderedDict[str,tuple[tuple,Optional[dict]]] = OrderedDict() # absolute folder path -> ((inode, modification time in ns, size) of its info.json and of its journal, merged content), least recently used first
+_info_dicts_paths: SortedPaths = SortedPaths() # keys of _info_dicts
+_info_dicts_lock: Lock = Lock() # _info_dicts is also modified by compaction threads, see start_info_journal_compaction()
+_info_cache_counters: dict[str,int] = {'hits': 0, 'misses': 0}
+
+def file_id(filepath: Path) -> Optional[tuple[int,int,int]]:
+    """
+    (inode, modification time in ns, size) of a file, None if it does not exist
+    """
+    try:
+        file_stat = stat(filepath)
+    except FileNotFoundError:
+        return None
+    return (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+
+def load_info_dict(path: Path) -> Optional[dict]:
+    """
+    Parsed info.json of the folder `path`, merged with its journal, or None if there is none.
+    The parsed content is cached, and reused as long as the inodes, the modification times and the sizes of both files are the same.
+    The returned dict is shared: it must not be modified.
+    """
+    files_id = (file_id(path / 'info.json'), file_id(path / INFO_JOURNAL_FILENAME))
+    key = abspath(path) # relative and absolute paths of a folder share the same entry
+    with _info_dicts_lock:
+        if files_id == (None, None):
+            if _info_dicts.pop(key,None) is not None:
+                _info_dicts_paths.discard(key)
+            return None
+        cached = _info_dicts.get(key,None)
+        if cached is not None and cached[0] == files_id:
+            _info_cache_counters['hits'] += 1
+            _info_dicts.move_to_end(key)
+            return cached[1]
+        _info_cache_counters['misses'] += 1
+    info_dict = read_info_dict(path) # outside of the lock, I/O
+    with _info_dicts_lock:
+        _info_dicts[key] = (files_id, info_dict)
+        _info_dicts.move_to_end(key)
+        _info_dicts_paths.add(key)
+        if len(_info_dicts) > INFO_CACHE_SIZE:
+            evicted_key, _ = _info_dicts.popitem(last=False) # evict the least recently used
+            _info_dicts_paths.discard(evicted_key)
+    return info_dict
+
+def forget_info_dict(path: Path):
+    """
+    Remove the parsed info.json of the folder `path` from the cache of load_info_dict()
+    """
+    key = abspath(path)
+    with _info_dicts_lock:
+        if _info_dicts.pop(key,None) is not None:
+            _info_dicts_paths.discard(key)
+
+def get_info_cache_stats() -> dict[str,int]:
+    """
+    Number of hits and misses of the info.json cache since the beginning of the process, and number of cached files
+    """
+    with _info_dicts_lock:
+        return {**_info_cache_counters, 'size': len(_info_dicts)}
+
+def get_generative_algorithm(path: Path) -> Optional[str]:
+    """
+    Open `path` info.json and retrieve first value mapped to a 'GenerativeAlgorithm' or an 'InteractiveGenerativeAlgorithm' key.
+    Not a DataFolder method to not require `path` from being instantiable.
+    """
+    if not path.exists():
+        log.fatal(f"{path} does not exist")
+        exit(1)
+    info_dict = load_info_dict(path)
+    if info_dict is not None:
+        for algo_info in info_dict.values(): # parse recorded algorithms. keys = date as ISO 8601, values = algo info
+            if 'GenerativeAlgorithm' in algo_info:
+                return algo_info['GenerativeAlgorithm']
+            elif 'InteractiveGenerativeAlgorithm' in algo_info:
+                return algo_info['InteractiveGenerativeAlgorithm']
+    else:
+        log.debug(f"There is no info.json inside {path}")
+    return None
+
+# if the algo was executed several times on this data folder,
+# return the first occurrence in the info.json file
+def get_datetime_key_of_algo_in_info_file(path: Path, algo_name: str) -> Optional[str]:
+    json_dict = load_info_dict(path)
+    if json_dict is not None:
+        for datetime_key,per_algo_info in json_dict.items():
+            if (
+                ('GenerativeAlgorithm' in per_algo_info.keys() and per_algo_info['GenerativeAlgorithm'] == algo_name) or 
+                ('TransformativeAlgorithm' in per_algo_info.keys() and per_algo_info['TransformativeAlgorithm'] == algo_name) or 
+                ('InteractiveGenerativeAlgorithm' in per_algo_info.keys() and per_algo_info['InteractiveGenerativeAlgorithm'] == algo_name)
+            ):
+                return datetime_key
+    return None
+
+def get_subfolders_of_type(path: Path, data_folder_type: str, from_index: bool = False) -> list[Path]:
+    if from_index and (dataset_index := get_dataset_index_covering(path)) is not None:
+        return dataset_index.get_subfolders_of_type(path, data_folder_type)
+    subfolders = list_subfolders(path)
+    return [subfolder for subfolder, inferred_type in zip(subfolders,type_inference_batch(subfolders)) if inferred_type == data_folder_type]
+
+def get_subfolders_generated_by(path: Path, generator_name: str, from_index: bool = False) -> list[Path]:
+    if from_index and (dataset_index := get_dataset_index_covering(path)) is not None:
+        return dataset_index.get_subfolders_generated_by(path, generator_name)
+    out = list()
+    for subfolder in list_subfolders(path):
+        json_dict = load_info_dict(subfolder)
+        if json_dict is not None:
+            for per_algo_info in json_dict.values():
+                if 'GenerativeAlgorithm' in per_algo_info.keys() and per_algo_info['GenerativeAlgorithm'] == generator_name:
+                    out.append(subfolder)
+    return out
+
+def folder_content_as_trees(folder: Path) -> list[Tree]:
+    from rich.tree import Tree
+    list_of_branches = list()
+    for subfolder in sorted(folder.iterdir()):
+        new_branch = Tree(subfolder.name)
+        if subfolder.is_dir():
+            new_branch = Tree(subfolder.name)
+            for subbranches in folder_content_as_trees(subfolder):
+                new_branch.add(subbranches)
+        list_of_branches.append(new_branch)
+    return list_of_branches
+
+def print_folder_as_tree(folder: Path):
+    from rich.tree import Tree
+    tree = Tree(str(folder))
+    for subfolder in folder_content_as_trees(folder):
+        tree.add(subfolder)
+    print(tree)
+
+def scan_folder(path: str) -> tuple[Optional[str],Optional[str],list[str]]:
+    """
+    Type, generative algorithm and sorted subfolders of a folder, from a single directory listing.
+    The info.json file (and its journal) is only opened if listed.
+    """
+    try:
+        with scandir(path) as it:
+            entries = list(it)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return (None, None, [])
+    filenames = [entry.name for entry in entries]
+    algo_str: Optional[str] = None
+    if 'info.json' in filenames or INFO_JOURNAL_FILENAME in filenames:
+        for algo_info in (read_info_dict(Path(path)) or dict()).values(): # same as get_generative_algorithm()
+            if 'GenerativeAlgorithm' in algo_info:
+                algo_str = algo_info['GenerativeAlgorithm']
+                break
+            elif 'InteractiveGenerativeAlgorithm' in algo_info:
+                algo_str = algo_info['InteractiveGenerativeAlgorithm']
+                break
+    return (
+        type_inference_from_filenames(path,filenames),
+        algo_str,
+        sorted([entry.path for entry in entries if entry.is_dir()])
+    )
+
+def scan_folders(paths: list[str]) -> list[tuple[Optional[str],Optional[str],list[str]]]:
+    return [scan_folder(path) for path in paths]
+
+WALK_CHUNK_SIZE: int = 16 # number of sibling folders listed by a single task of walk_children()
+
+def walk_children(path: Path, max_depth: Optional[int] = None, nb_threads: Optional[int] = None) -> Iterator[tuple[int,Path,Optional[str],Optional[str]]]:
+    """
+    Depth-first walk of the folders below `path`, visiting each folder once.
+    Yield (depth, subfolder path, type, generative algo), depth being 1 for the subfolders of `path`, in the same order as list_children(recursive=True).
+    Folders are listed by a pool of `nb_threads` threads (default of ThreadPoolExecutor, no pool if 1): the subfolders of a folder are submitted,
+    by chunks of siblings, as soon as it is yielded, so that directory listings and info.json reads overlap (useful on network filesystems)
+    while the number of pending listings stays bounded by the width of the tree.
+    """
+    from concurrent.futures import ThreadPoolExecutor, Future
+    get_definitions() # load the definitions before spawning threads
+    if max_depth is not None and max_depth < 1:
+        return
+    with ThreadPoolExecutor(nb_threads) as executor:
+        def submit(subfolders: list[str]) -> Future:
+            if nb_threads == 1:
+                future: Future = Future()
+                future.set_result(scan_folders(subfolders))
+                return future
+            return executor.submit(scan_folders, subfolders)
+        # stack of (depth, path, future of the scan_folders() call including this path, position in it), next folder to yield on top
+        stack: list[tuple[int,str,Future,int]] = list()
+        def push(depth: int, subfolders: list[str]):
+            chunks = [subfolders[begin:begin+WALK_CHUNK_SIZE] for begin in range(0,len(subfolders),WALK_CHUNK_SIZE)]
+            for chunk in reversed(chunks):
+                future = submit(chunk)
+                stack.extend([(depth, subfolder, future, position) for position, subfolder in reversed(list(enumerate(chunk)))])
+        push(1, scan_folder(str(path))[2])
+        try:
+            while len(stack) != 0:
+                depth, subfolder, future, position = stack.pop()
+                type_str, algo_str, subsubfolders = future.result()[position]
+                yield (depth, Path(subfolder), type_str, algo_str)
+                if max_depth is None or depth < max_depth:
+                    push(depth+1, subsubfolders)
+        finally:
+            for _, _, future, _ in stack:
+                future.cancel() # the caller stopped iterating
+
+def list_children(path: Path, type_filter: Optional[list[str]] = None, algo_filter: Optional[list[str]] = None, recursive: bool = False, from_index: bool = False) -> list[tuple[Path,Optional[str],Optional[str]]]:
+    if from_index and (dataset_index := get_dataset_index_covering(path)) is not None:
+        return dataset_index.list_children(path,type_filter,algo_filter,recursive)
+    children: list[tuple[Path,Optional[str],Optional[str]]] = list() # list of tuples, each item being (subfolder path, type, generative algo)
+    for _, subfolder, type_str, algo_str in walk_children(path, None if recursive else 1):
+        if (type_filter is None or (type_str is not None and type_str in type_filter)) and \
+           (algo_filter is None or (algo_str is not None and algo_str in algo_filter)):
+            children.append((subfolder,type_str,algo_str))
+    return children
+
+def print_children(path: Path, type_filter: Optional[list[str]] = None, algo_filter: Optional[list[str]] = None, recursive: bool = False, parent_tree: Optional[Tree] = None, max_depth: Optional[int] = None):
+    from rich.console import Console
+    from rich.tree import Tree
+    tree: Tree = parent_tree if parent_tree is not None else Tree('',hide_root=True)
+    branches: list[Tree] = [tree] # branches[d] is where folders of depth d+1 are added
+    for (depth,subpath,type_str,algo_str) in walk_children(path, max_depth if recursive else 1):
+        # filter: should this path be printed?
+        if (type_filter is None or (type_str is not None and type_str in type_filter)) and \
+           (algo_filter is None or (algo_str is not None and algo_str in algo_filter)):
+            if type_filter is not None or algo_filter is not None:
+                # add elements to `tree` and not to a branch -> print a list (hide_root is on)
+                tree.add(f'[orange1]{subpath}[/] [bright_black]?[/]' if type_str is None else f'{subpath} [bright_black]{type_str}[/]')
+            else:
+                # add elements to the branch of their parent -> print a tree
+                del branches[depth:]
+                branches.append(branches[depth-1].add(f'[orange1]{subpath}[/] [bright_black]?[/]' if type_str is None else f'{subpath} [bright_black]{type_str}[/]'))
+    if parent_tree is None: # if we are in the top-level function call
+        console = Console()
+        console.print(tree)
+
+CHILDREN_FORMATS: list[str] = ['tree','ndjson','tsv'] # output formats of `dds.py children`
+
+def stream_children(path: Path, output_format: str, type_filter: Optional[list[str]] = None, algo_filter: Optional[list[str]] = None, max_depth: Optional[int] = None, file = None):
+    """
+    Write one record per folder below `path`, as soon as it is found, with constant memory:
+    - 'ndjson' : one JSON object per line, with 'path', 'type' and 'algo' (generative algorithm), null if unknown
+    - 'tsv' : path, type and generative algorithm separated by tabulations, empty if unknown
+    """
+    assert(output_format in ['ndjson','tsv'])
+    file = file if file is not None else sys.stdout
+    for (_,subpath,type_str,algo_str) in walk_children(path, max_depth):
+        if (type_filter is None or (type_str is not None and type_str in type_filter)) and \
+           (algo_filter is None or (algo_str is not None and algo_str in algo_filter)):
+            if output_format == 'ndjson':
+                file.write(json.dumps({'path': str(subpath), 'type': type_str, 'algo': algo_str}) + '\n')
+            else:
+                file.write(f"{subpath}\t{type_str or ''}\t{algo_str or ''}\n")
+            file.flush() # let the consumer process records immediately
+
+DATASET_INDEX_FILE: Path = Path('.cache/index.sqlite')
+
+DATASET_INDEX_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS roots (
+    path TEXT PRIMARY KEY,          -- absolute path of a folder given to `dds.py index`
+    last_refresh REAL               -- Unix time
+);
+CREATE TABLE IF NOT EXISTS folders (
+    path TEXT PRIMARY KEY,          -- absolute path
+    parent TEXT,                    -- absolute path of the parent folder
+    mtime_ns INTEGER,               -- modification time of the folder when indexed
+    info_mtime_ns INTEGER,          -- latest modification time of its info.json and of its journal when indexed, 0 if missing
+    stats_mtime_ns INTEGER,         -- latest modification time of its stats files when indexed, 0 if none
+    type TEXT,                      -- inferred data folder type, NULL if not a data folder
+    generative_algorithm TEXT       -- see get_generative_algorithm()
+);
+CREATE INDEX IF NOT EXISTS folders_parent ON folders(parent);
+CREATE INDEX IF NOT EXISTS folders_type ON folders(type);
+CREATE TABLE IF NOT EXISTS runs (
+    path TEXT,                      -- data folder in which info.json has this entry
+    run TEXT,                       -- key of the entry in info.json (date and time)
+    kind TEXT,                      -- GenerativeAlgorithm, TransformativeAlgorithm or InteractiveGenerativeAlgorithm
+    algorithm TEXT,
+    return_code INTEGER,
+    duration REAL                   -- in seconds
+);
+CREATE INDEX IF NOT EXISTS runs_path ON runs(path);
+CREATE INDEX IF NOT EXISTS runs_algorithm ON runs(algorithm);
+CREATE TABLE IF NOT EXISTS parameters (
+    path TEXT,
+    run TEXT,
+    name TEXT,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS parameters_path ON parameters(path);
+CREATE TABLE IF NOT EXISTS stats (
+    path TEXT,
+    filename_keyword TEXT,          -- a *_STATS_JSON filename keyword
+    name TEXT,                      -- dot-separated keys inside the JSON file, like 'turning-points.nb'
+    value REAL
+);
+CREATE INDEX IF NOT EXISTS stats_path ON stats(path);
+"""
+DATASET_INDEX_VERSION: int = 2 # to increment when DATASET_INDEX_SCHEMA changes, the index is then rebuilt
+
+RUN_KINDS: list[str] = ['GenerativeAlgorithm','TransformativeAlgorithm','InteractiveGenerativeAlgorithm'] # possible keys of an info.json entry naming the algorithm
+
+def flatten_numeric_values(JSON_content, prefix: str = '') -> list[tuple[str,float]]:
+    """
+    (dot-separated keys, value) of each number (or boolean) inside nested JSON objects
+    """
+    out = list()
+    if isinstance(JSON_content,dict):
+        for key, value in JSON_content.items():
+            out.extend(flatten_numeric_values(value, f'{prefix}.{key}' if prefix != '' else str(key)))
+    elif isinstance(JSON_content,(bool,int,float)):
+        out.append((prefix,float(JSON_content)))
+    return out
+
+class DatasetIndex():
+    """
+    SQLite index of the folders below some root folders (see `dds.py index`), with their type, the content of their info.json
+    and the numbers of their stats files, to answer queries without walking the filesystem nor parsing JSON files.
+    A refresh only lists again the folders whose modification time (or the one of their info.json or of their stats files) changed.
+    """
+
+    def __init__(self, database_path: Path = DATASET_INDEX_FILE):
+        import sqlite3
+        database_path.parent.mkdir(exist_ok=True)
+        self.database_path: Path = database_path
+        self.connection = sqlite3.connect(database_path)
+        if self.connection.execute('PRAGMA user_version').fetchone()[0] != DATASET_INDEX_VERSION:
+            # index written by another version of dds.py (or new file) -> start from scratch
+            self.connection.executescript(''.join([f'DROP TABLE IF EXISTS {table};' for table in ['roots','folders','runs','parameters','stats']]))
+            self.connection.execute(f'PRAGMA user_version = {DATASET_INDEX_VERSION}')
+        self.connection.executescript(DATASET_INDEX_SCHEMA)
+
+    @staticmethod
+    def normalize(path: Path) -> str:
+        return abspath(path)
+
+    @staticmethod
+    def info_mtime_ns(folder: str) -> int:
+        # latest modification of info.json or of its journal
+        mtime_ns = 0
+        for filename in ['info.json', INFO_JOURNAL_FILENAME]:
+            try:
+                mtime_ns = max(mtime_ns, stat(join(folder,filename)).st_mtime_ns)
+            except OSError: # missing, or unreadable folder
+                pass
+        return mtime_ns
+
+    @staticmethod
+    def stats_mtime_ns(folder: str, data_folder_type: Optional[str]) -> int:
+        # latest modification of the stats files of a data folder. Rewriting one in place changes neither the folder nor its info.json
+        mtime_ns = 0
+        if data_folder_type is not None:
+            for filename_keyword, filename in get_definitions().data_folder_types.get(data_folder_type,dict()).get('filenames',dict()).items():
+                if not filename_keyword.endswith('_STATS_JSON'):
+                    continue
+                try:
+                    mtime_ns = max(mtime_ns, stat(join(folder,filename)).st_mtime_ns)
+                except OSError:
+                    pass
+        return mtime_ns
+
+    def covers(self, path: Path) -> bool:
+        """
+        Whether `path` is inside a folder given to refresh()
+        """
+        path_str = self.normalize(path)
+        return self.connection.execute(
+            "SELECT 1 FROM roots WHERE path = ? OR substr(?,1,length(path)+1) = path || '/' OR path = '/'",
+            (path_str,path_str)
+        ).fetchone() is not None
+
+    def remove(self, folder: str):
+        """
+        Remove a folder and everything below from the index
+        """
+        for table in ['folders','runs','parameters','stats']:
+            self.connection.execute(f'DELETE FROM {table} WHERE path = ? OR substr(path,1,?) = ?', (folder,len(folder)+1,folder+'/'))
+
+    def index_folder(self, folder: str, mtime_ns: int, info_mtime_ns: int) -> list[str]:
+        """
+        (Re-)index a single folder. Return its subfolders.
+        An unreadable folder is skipped with a warning (it will be tried again at the next refresh), a removed one is removed from the index.
+        """
+        try:
+            with scandir(folder) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError):
+            self.remove(folder)
+            return []
+        except PermissionError as e:
+            log.warning(f'Cannot list {folder} ({e.strerror}), it will not be indexed')
+            return []
+        filenames = [entry.name for entry in entries]
+        subfolders = sorted([entry.path for entry in entries if entry.is_dir()])
+        data_folder_type: Optional[str] = type_inference_from_filenames(Path(folder),filenames)
+        # forget the previous content, including subfolders that no longer exist
+        for table in ['runs','parameters','stats']:
+            self.connection.execute(f'DELETE FROM {table} WHERE path = ?', (folder,))
+        for (previous_subfolder,) in self.connection.execute('SELECT path FROM folders WHERE parent = ?', (folder,)).fetchall():
+            if previous_subfolder not in subfolders:
+                self.remove(previous_subfolder)
+        generative_algorithm: Optional[str] = None
+        if 'info.json' in filenames or INFO_JOURNAL_FILENAME in filenames:
+            try:
+                info_dict = read_info_dict(Path(folder)) or dict()
+            except (json.JSONDecodeError, OSError):
+                log.warning(f'Cannot read {join(folder,"info.json")}, it will not be indexed')
+                info_dict = dict()
+            for run, algo_info in info_dict.items():
+                kind = next((key for key in RUN_KINDS if key in algo_info),None)
+                if kind is None:
+                    continue
+                if generative_algorithm is None and kind in ['GenerativeAlgorithm','InteractiveGenerativeAlgorithm']:
+                    generative_algorithm = algo_info[kind]
+                duration = algo_info['duration'][0] if isinstance(algo_info.get('duration',None),list) else algo_info.get('duration',None)
+                self.connection.execute('INSERT INTO runs VALUES (?,?,?,?,?,?)', (folder,run,kind,algo_info[kind],algo_info.get('return_code',None),duration))
+                self.connection.executemany('INSERT INTO parameters VALUES (?,?,?,?)', [(folder,run,name,str(value)) for name, value in algo_info.get('parameters',dict()).items()])
+        stats_mtime_ns = self.stats_mtime_ns(folder,data_folder_type) # before reading them: a concurrent rewrite will be seen by the next refresh
+        if data_folder_type is not None:
+            for filename_keyword, filename in get_definitions().data_folder_types[data_folder_type]['filenames'].items():
+                if not filename_keyword.endswith('_STATS_JSON') or filename not in filenames:
+                    continue
+                try:
+                    with open(join(folder,filename)) as stats_file:
+                        stats = json.load(stats_file)
+                except (json.JSONDecodeError, OSError):
+                    log.warning(f'Cannot read {join(folder,filename)}, it will not be indexed')
+                    continue
+                self.connection.executemany('INSERT INTO stats VALUES (?,?,?,?)', [(folder,filename_keyword,name,value) for name, value in flatten_numeric_values(stats)])
+        self.connection.execute('INSERT OR REPLACE INTO folders VALUES (?,?,?,?,?,?,?)', (folder,dirname(folder),mtime_ns,info_mtime_ns,stats_mtime_ns,data_folder_type,generative_algorithm))
+        return subfolders
+
+    def refresh(self, root: Path) -> tuple[int,int]:
+        """
+        Index `root` and all folders below. Return the number of folders visited and the number of folders (re-)indexed.
+        Folders whose modification time, info.json modification time and stats files modification time did not change since the last refresh
+        are not listed: their subfolders are retrieved from the index.
+        """
+        root_str = self.normalize(root)
+        known: dict[str,tuple[int,int,int,Optional[str]]] = {
+            path: (mtime_ns,info_mtime_ns,stats_mtime_ns,data_folder_type) for path, mtime_ns, info_mtime_ns, stats_mtime_ns, data_folder_type in
+            self.connection.execute('SELECT path, mtime_ns, info_mtime_ns, stats_mtime_ns, type FROM folders WHERE path = ? OR substr(path,1,?) = ?', (root_str,len(root_str)+1,root_str+'/'))
+        }
+        nb_visited = 0
+        nb_indexed = 0
+        with self.connection: # single transaction
+            stack: list[str] = [root_str]
+            while len(stack) != 0:
+                folder = stack.pop()
+                nb_visited += 1
+                try:
+                    mtime_ns = stat(folder).st_mtime_ns
+                except FileNotFoundError:
+                    self.remove(folder)
+                    continue
+                except PermissionError as e:
+                    log.warning(f'Cannot access {folder} ({e.strerror}), it will not be indexed')
+                    continue
+                info_mtime_ns = self.info_mtime_ns(folder)
+                previous = known.get(folder,None)
+                if previous is not None and previous[0:2] == (mtime_ns,info_mtime_ns) and previous[2] == self.stats_mtime_ns(folder,previous[3]):
+                    subfolders = [path for (path,) in self.connection.execute('SELECT path FROM folders WHERE parent = ?', (folder,))]
+                else:
+                    subfolders = self.index_folder(folder,mtime_ns,info_mtime_ns)
+                    nb_indexed += 1
+                stack.extend(reversed(subfolders))
+            self.connection.execute('INSERT OR REPLACE INTO roots VALUES (?,?)', (root_str,time.time()))
+        return nb_visited, nb_indexed
+
+    def update_folder(self, folder: Path):
+        """
+        Re-index a single folder (not its subfolders), or remove it if it no longer exists
+        """
+        folder_str = self.normalize(folder)
+        with self.connection:
+            try:
+                mtime_ns = stat(folder_str).st_mtime_ns
+            except FileNotFoundError:
+                self.remove(folder_str)
+                return
+            self.index_folder(folder_str,mtime_ns,self.info_mtime_ns(folder_str))
+
+    def list_children(self, path: Path, type_filter: Optional[list[str]] = None, algo_filter: Optional[list[str]] = None, recursive: bool = False) -> list[tuple[Path,Optional[str],Optional[str]]]:
+        """
+        Same as list_children(), from the index
+        """
+        children: list[tuple[Path,Optional[str],Optional[str]]] = list()
+        for subfolder, type_str, algo_str in self.connection.execute('SELECT path, type, generative_algorithm FROM folders WHERE parent = ? ORDER BY path', (self.normalize(path),)).fetchall():
+            if (type_filter is None or (type_str is not None and type_str in type_filter)) and \
+               (algo_filter is None or (algo_str is not None and algo_str in algo_filter)):
+                children.append((Path(path) / basename(subfolder),type_str,algo_str))
+            if recursive:
+                children.extend(self.list_children(Path(path) / basename(subfolder),type_filter,algo_filter,True))
+        return children
+
+    # Paths below `path` are returned in the same form (relative/absolute) as `path`, like when walking the filesystem
+
+    def get_subfolders_of_type(self, path: Path, data_folder_type: str) -> list[Path]:
+        return [Path(path) / basename(subfolder) for (subfolder,) in self.connection.execute(
+            'SELECT path FROM folders WHERE parent = ? AND type = ? ORDER BY path',
+            (self.normalize(path),data_folder_type)
+        )]
+
+    def get_subfolders_generated_by(self, path: Path, generator_name: str) -> list[Path]:
+        return [Path(path) / basename(subfolder) for (subfolder,) in self.connection.execute(
+            "SELECT DISTINCT folders.path FROM folders JOIN runs ON runs.path = folders.path WHERE folders.parent = ? AND runs.kind = 'GenerativeAlgorithm' AND runs.algorithm = ? ORDER BY folders.path",
+            (self.normalize(path),generator_name)
+        )]
+
+    def find(self, root: Path, criteria: list[tuple[str,str,str]]) -> list[Path]:
+        """
+        Folders below `root` (included) matching all `criteria`, see find_data_folders()
+        """
+        root_str = self.normalize(root)
+        conditions: list[str] = ['(folders.path = ? OR substr(folders.path,1,?) = ?)']
+        values: list = [root_str,len(root_str)+1,root_str+'/']
+        run_conditions: list[str] = list()
+        run_values: list = list()
+        for field, operator, value in criteria:
+            if field in ['type','algo']:
+                if operator not in ['=','!=']:
+                    log.error(f"Only '=' and '!=' can be used on '{field}'")
+                    exit(1)
+                conditions.append(f"{'folders.type' if field == 'type' else 'folders.generative_algorithm'} {operator} ?")
+                values.append(value)
+            elif field == 'run':
+                if operator not in ['=','!=']:
+                    log.error(f"Only '=' and '!=' can be used on '{field}'")
+                    exit(1)
+                run_conditions.append(f'runs.algorithm {operator} ?')
+                run_values.append(value)
+            elif field in ['return_code','duration']:
+                run_conditions.append(f'runs.{field} {operator} ?')
+                run_values.append(parse_criterion_number(field,value))
+            elif field.startswith('param.'):
+                run_conditions.append(f"EXISTS (SELECT 1 FROM parameters WHERE parameters.path = runs.path AND parameters.run = runs.run AND parameters.name = ? AND {'CAST(parameters.value AS REAL)' if is_number(value) else 'parameters.value'} {operator} ?)")
+                run_values += [field[len('param.'):], float(value) if is_number(value) else value]
+            else:
+                # stats value, the field can be a suffix of the dot-separated keys: 'hex_SJ.min' matches 'cells.quality.hex_SJ.min'
+                conditions.append(f'EXISTS (SELECT 1 FROM stats WHERE stats.path = folders.path AND (stats.name = ? OR substr(stats.name,-?) = ?) AND stats.value {operator} ?)')
+                values += [field,len(field)+1,'.'+field,parse_criterion_number(field,value)]
+        if len(run_conditions) != 0:
+            # all run criteria must be satisfied by the same run
+            conditions.append(f"EXISTS (SELECT 1 FROM runs WHERE runs.path = folders.path AND {' AND '.join(run_conditions)})")
+            values += run_values
+        return [Path(path) for (path,) in self.connection.execute(f"SELECT folders.path FROM folders WHERE {' AND '.join(conditions)} ORDER BY folders.path", values)]
+
+_dataset_index: Optional[DatasetIndex] = None # process-wide instance, see get_dataset_index()
+
+def get_dataset_index() -> DatasetIndex:
+    global _dataset_index
+    if _dataset_index is None:
+        _dataset_index = DatasetIndex()
+    return _dataset_index
+
+_unindexed_warnings: set[str] = set() # folders for which get_dataset_index_covering() already warned
+
+def get_dataset_index_covering(path: Path) -> Optional[DatasetIndex]:
+    """
+    Return the dataset index if `path` has been indexed, else None
+    (with a warning, unless there was already one for `path` or for a folder above)
+    """
+    if not DATASET_INDEX_FILE.exists() or not get_dataset_index().covers(path):
+        path_str = DatasetIndex.normalize(path)
+        ancestor = path_str
+        while ancestor not in _unindexed_warnings:
+            if dirname(ancestor) == ancestor: # '/'
+                _unindexed_warnings.add(path_str)
+                log.warning(f'{collapseuser(path)} is not indexed (see `dds.py index`), walking the filesystem instead')
+                break
+            ancestor = dirname(ancestor)
+        return None
+    return get_dataset_index()
+
+CRITERION_OPERATORS: list[str] = ['!=','<=','>=','=','<','>'] # two-character operators first
+
+def is_number(value: str) -> bool:
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+def parse_criterion_number(field: str, value: str) -> float:
+    if not is_number(value):
+        log.error(f"Expecting a number for '{field}', got '{value}'")
+        exit(1)
+    return float(value)
+
+def parse_criterion(criterion: str) -> tuple[str,str,str]:
+    """
+    Split a criterion like 'turning-points.nb>0' into ('turning-points.nb','>','0')
+    """
+    for position in range(1,len(criterion)):
+        for operator in CRITERION_OPERATORS:
+            if criterion.startswith(operator,position):
+                return (criterion[:position], operator, criterion[position+len(operator):])
+    log.error(f"Invalid criterion '{criterion}', expecting <field><operator><value> with an operator among {' '.join(CRITERION_OPERATORS)}")
+    exit(1)
+
+def find_data_folders(root: Path, criteria: list[str], refresh: bool = False) -> list[Path]:
+    """
+    Folders below `root` (included) matching all `criteria`, answered from the dataset index.
+    Each criterion is <field><operator><value>, operators being = != < <= > >=. Fields are:
+    - `type` : data folder type
+    - `algo` : generative algorithm of the folder
+    - `run` : name of an algorithm executed on the folder
+    - `return_code`, `duration` (in seconds) : of an algorithm executed on the folder
+    - `param.<name>` : value of a parameter of an algorithm executed on the folder
+    - any other field is a number in a stats file, possibly given by its last keys only (`hex_SJ.min` for `cells.quality.hex_SJ.min`)
+    `run`, `return_code`, `duration` and `param.*` criteria must be satisfied by the same run.
+    If `root` is not indexed yet, or if `refresh`, the index is refreshed first.
+    """
+    parsed_criteria = [parse_criterion(criterion) for criterion in criteria]
+    dataset_index = get_dataset_index()
+    if refresh or not dataset_index.covers(root):
+        dataset_index.refresh(root)
+    return dataset_index.find(root,parsed_criteria)
+
+# inotify(7) constants, see /usr/include/linux/inotify.h
+# No IN_MODIFY: it is sent on each write(), e.g. of the logs of a running algorithm, while files (info.json and its journal included)
+# are re-indexed once written, on IN_CLOSE_WRITE, or once renamed, on IN_MOVED_TO
+IN_CLOSE_WRITE: int  = 0x00000008
+IN_MOVED_FROM: int   = 0x00000040
+IN_MOVED_TO: int     = 0x00000080
+IN_CREATE: int       = 0x00000100
+IN_DELETE: int       = 0x00000200
+IN_DELETE_SELF: int  = 0x00000400
+IN_Q_OVERFLOW: int   = 0x00004000
+IN_IGNORED: int      = 0x00008000
+IN_ONLYDIR: int      = 0x01000000
+IN_ISDIR: int        = 0x40000000
+IN_CLOEXEC: int      = 0o2000000
+INOTIFY_WATCH_MASK: int = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_ONLYDIR
+
+class DatasetWatcher():
+    """
+    Keep the dataset index of a root folder up to date with inotify(7), see `dds.py watch`.
+    Events are coalesced: after a first event, events are accumulated until none arrives for `coalescing_delay` seconds
+    (or for at most `max_latency` seconds), then each modified folder is re-indexed once, in a single transaction.
+    """
+
+    def __init__(self, root: Path, coalescing_delay: float = 0.5, max_latency: float = 5.0):
+        import ctypes
+        import ctypes.util
+        if not sys.platform.startswith('linux'):
+            log.fatal('`dds.py watch` relies on inotify, only available on Linux')
+            exit(1)
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd: int = self.libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            log.fatal(f'inotify_init1() failed : {strerror(ctypes.get_errno())}')
+            exit(1)
+        self.root: str = DatasetIndex.normalize(root)
+        self.coalescing_delay: float = coalescing_delay
+        self.max_latency: float = max_latency
+        self.index: DatasetIndex = get_dataset_index()
+        self.watched_folders: dict[int,str] = dict() # watch descriptor -> folder
+
+    def add_watch(self, folder: str):
+        import ctypes
+        import errno
+        wd = self.libc.inotify_add_watch(self.fd, folder.encode(), INOTIFY_WATCH_MASK)
+        if wd < 0:
+            error_number = ctypes.get_errno()
+            if error_number == errno.ENOSPC:
+                log.fatal('Reached the maximum number of inotify watches, increase /proc/sys/fs/inotify/max_user_watches')
+                exit(1)
+            # the folder may have been removed in the meantime, the next events of its parent will tell
+            log.debug(f'inotify_add_watch({folder}) failed : {strerror(error_number)}')
+            return
+        self.watched_folders[wd] = folder
+
+    def index_new_subtree(self, folder: str) -> int:
+        """
+        Watch and index a folder that just appeared, and all folders below. Return the number of indexed folders.
+        The watch is added before the folder is listed, so files created in between are not missed.
+        """
+        nb_indexed = 0
+        stack: list[str] = [folder]
+        while len(stack) != 0:
+            current_folder = stack.pop()
+            self.add_watch(current_folder)
+            try:
+                mtime_ns = stat(current_folder).st_mtime_ns
+                stack.extend(self.index.index_folder(current_folder,mtime_ns,self.index.info_mtime_ns(current_folder)))
+            except (FileNotFoundError,NotADirectoryError):
+                self.index.remove(current_folder)
+                continue
+            nb_indexed += 1
+        return nb_indexed
+
+    def read_events(self, timeout: Optional[float]) -> list[tuple[int,int,str]]:
+        """
+        (watch descriptor, mask, name) of pending events, waiting at most `timeout` seconds (forever if None)
+        """
+        from os import read
+        import select
+        import struct
+        if len(select.select([self.fd],[],[],timeout)[0]) == 0:
+            return []
+        buffer = read(self.fd, 1 << 16)
+        events = list()
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _, name_length = struct.unpack_from('iIII', buffer, offset)
+            offset += struct.calcsize('iIII')
+            name = buffer[offset:offset+name_length].rstrip(b'\0').decode(errors='surrogateescape')
+            offset += name_length
+            events.append((wd,mask,name))
+        return events
+
+    def watch(self):
+        nb_visited, nb_indexed = self.index.refresh(Path(self.root))
+        for (folder,) in self.index.connection.execute('SELECT path FROM folders WHERE path = ? OR substr(path,1,?) = ?', (self.root,len(self.root)+1,self.root+'/')).fetchall():
+            self.add_watch(folder)
+        print(f'Watching {len(self.watched_folders)} folders below {collapseuser(Path(self.root))} ({nb_indexed} (re-)indexed at startup), Ctrl+C to stop')
+        while True:
+            modified_folders: set[str] = set()
+            new_folders: set[str] = set()
+            overflow = False
+            events = self.read_events(None)
+            first_event_time = time.monotonic()
+            while len(events) != 0:
+                for wd, mask, name in events:
+                    if mask & IN_Q_OVERFLOW:
+                        overflow = True
+                        continue
+                    folder = self.watched_folders.get(wd,None)
+                    if mask & IN_IGNORED:
+                        self.watched_folders.pop(wd,None) # the folder was removed
+                        continue
+                    if folder is None:
+                        continue
+                    if mask & IN_DELETE_SELF:
+                        modified_folders.add(dirname(folder))
+                        continue
+                    modified_folders.add(folder)
+                    if (mask & IN_ISDIR) and (mask & (IN_CREATE | IN_MOVED_TO)):
+                        new_folders.add(join(folder,name))
+                if time.monotonic() - first_event_time > self.max_latency:
+                    break
+                events = self.read_events(self.coalescing_delay)
+            chrono_start = time.monotonic()
+            if overflow:
+                # some events were lost, fall back to an incremental refresh (only modified folders are re-listed)
+                log.warning('inotify event queue overflow, refreshing the whole index')
+                self.index.refresh(Path(self.root))
+                known_folders = set(self.watched_folders.values())
+                for (folder,) in self.index.connection.execute('SELECT path FROM folders WHERE path = ? OR substr(path,1,?) = ?', (self.root,len(self.root)+1,self.root+'/')).fetchall():
+                    if folder not in known_folders:
+                        self.add_watch(folder)
+                print(f'{time.strftime("%H:%M:%S")} full refresh in {simple_human_readable_duration(time.monotonic() - chrono_start)}')
+                continue
+            nb_indexed = 0
+            with self.index.connection: # single transaction
+                # parents before children, so that a new subtree is not indexed twice
+                for folder in sorted(new_folders):
+                    if not any(folder.startswith(other_folder + '/') for other_folder in new_folders):
+                        nb_indexed += self.index_new_subtree(folder)
+                for folder in sorted(modified_folders - new_folders):
+                    if any(folder.startswith(new_folder + '/') for new_folder in new_folders):
+                        continue # already indexed with its new parent
+                    if folder != self.root and not folder.startswith(self.root + '/'):
+                        continue # parent of the root
+                    try:
+                        mtime_ns = stat(folder).st_mtime_ns
+                    except FileNotFoundError:
+                        self.index.remove(folder)
+                        continue
+                    self.index.index_folder(folder,mtime_ns,self.index.info_mtime_ns(folder))
+                    nb_indexed += 1
+            print(f'{time.strftime("%H:%M:%S")} {nb_indexed} folders (re-)indexed in {simple_human_readable_duration(time.monotonic() - chrono_start)}')
+
+def parse_arguments_list(arguments_as_list: list) -> dict:
+    """
+    Convert arguments to a dict
+    -> from ['arg1=value', 'arg2=value'] to {'arg1': 'value', 'arg2': 'value'}
+    """
+    arguments = dict()
+    for arg in arguments_as_list:
+        if arg.count('=') == 1:
+            arg = arg.split('=')
+            arguments[arg[0]] = arg[1]
+        else:
+            log.error(f"No '=' in supplemental argument '{arg}'")
+            exit(1)
+    return arguments
+
+# Execute either <algo_name>.yml or <algo_name>.py
+# The fist one must be executed on an instance of DataFolder
+# The second has not this constraint (any folder, eg the parent folder of many DataFolder)
+def run(path: Path, algo_name: str, arguments_as_list: list = list(), silent_output: bool = False, timeout: Optional[float] = None) -> dict:
+    if algo_name not in get_definitions().algorithms:
+        # it can be the name of a custom algorithm, defined in an <algo_name>.py
+        YAML_filepath: Path = Path('definitions/algorithms') / (algo_name + '.yml')
+        script_filepath: Path = Path('definitions/algorithms') / (algo_name + '.py')
+        if algo_name not in get_definitions().algorithms_as_Python_script:
+            log.error(f"Cannot run '{algo_name}' because neither {YAML_filepath} nor {script_filepath} exist")
+            exit(1)
+        from rich.console import Console
+        from rich.rule import Rule
+        
+        ext_module = load_Python_module(script_filepath)
+
+        console = Console()
+        if not silent_output:
+            console.print(Rule(f'beginning of [magenta]{script_filepath}[/]'))
+        ext_module.main(path,arguments_as_list)
+        notify_folder_modified(path)
+        if not silent_output:
+            console.print(Rule(f'end of [magenta]{script_filepath}[/]'))
+        exit(0)
+    arguments = parse_arguments_list(arguments_as_list)
+    data_folder = DataFolder(path)
+    return data_folder.run(algo_name,arguments,silent_output=silent_output,timeout=timeout)
+
+RUN_JOB_STATUSES: list[str] = ['done','failed','timeout','error','crashed'] # see RunJobResult
+
+class RunJobResult():
+    """
+    Outcome of an algorithm executed on a data folder by run_many(). `status` is:
+    - 'done' : the command returned 0
+    - 'failed' : the command returned another code
+    - 'timeout' : the command was killed after the timeout of the algorithm
+    - 'error' : dds.py stopped before or after the command (exit() or exception), see `message`
+    - 'crashed' : the worker process died
+    """
+
+    __slots__ = ('path','status','return_code','duration','message')
+
+    def __init__(self, path: Path, status: str, return_code: Optional[int] = None, duration: Optional[float] = None, message: str = ''):
+        assert(status in RUN_JOB_STATUSES)
+        self.path: Path = path
+        self.status: str = status
+        self.return_code: Optional[int] = return_code
+        self.duration: Optional[float] = duration
+        self.message: str = message
+
+    def __repr__(self) -> str:
+        return f"RunJobResult('{self.path}', '{self.status}', return_code={self.return_code})"
+
+def run_job(path: Path, algo_name: str, arguments_as_list: list, timeout: Optional[float] = None) -> RunJobResult:
+    """
+    Execute run() in a worker process of run_many(), without letting an exit() or an exception of this job reach the pool
+    """
+    import traceback
+    chrono_start = time.monotonic()
+    try:
+        info_entry = run(path, algo_name, list(arguments_as_list), silent_output=True, timeout=timeout)
+    except SystemExit as e:
+        if e.code in [0, None]: # algorithm defined as a Python script, run() exits after its main()
+            return RunJobResult(path, 'done', 0, time.monotonic() - chrono_start)
+        return RunJobResult(path, 'error', None, time.monotonic() - chrono_start, f'exit({e.code}), see the log above')
+    except Exception as e:
+        log.debug(traceback.format_exc())
+        return RunJobResult(path, 'error', None, time.monotonic() - chrono_start, f'{type(e).__name__}: {e}')
+    if info_entry.get('status',None) == 'timeout':
+        return RunJobResult(path, 'timeout', info_entry['return_code'], info_entry['duration'][0], f"killed after {simple_human_readable_duration(info_entry['timeout'])}")
+    return RunJobResult(path, 'done' if info_entry['return_code'] == 0 else 'failed', info_entry['return_code'], info_entry['duration'][0])
+
+class RunResources():
+    """
+    Resources needed by a run, declared in the 'resources' entry of <algo>.yml for each input data folder type, and used by run_many() to pack jobs
+    onto the CPU slots and the memory of the machine:
+    - `threads` : number of CPU slots used (default: 1)
+    - `memory_gb` : memory needed, in GB (default: 0, not accounted)
+    - `exclusive` : if the run must be the only one (e.g. interactive tools)
+    - `group` and `group_limit` : at most `group_limit` runs of the same group at a time (e.g. license-limited tools)
+    """
+
+    __slots__ = ('threads','memory_gb','exclusive','group','group_limit')
+
+    def __init__(self, threads: int = 1, memory_gb: float = 0.0, exclusive: bool = False, group: Optional[str] = None, group_limit: int = 1):
+        self.threads: int = threads
+        self.memory_gb: float = memory_gb
+        self.exclusive: bool = exclusive
+        self.group: Optional[str] = group
+        self.group_limit: int = group_limit
+
+    def __repr__(self) -> str:
+        return f"RunResources(threads={self.threads}, memory_gb={self.memory_gb}, exclusive={self.exclusive}, group={self.group}, group_limit={self.group_limit})"
+
+def get_run_resources(algo_name: str, data_folder_type: Optional[str], arguments: dict = dict()) -> RunResources:
+    """
+    Resources needed to run an algorithm on a data folder of the given type, with the given 'others' arguments (as strings, like in run())
+    overwriting the default values referenced by `threads`. Default resources if the algorithm is a Python script or its input type is unknown
+    """
+    definitions = get_definitions()
+    if algo_name not in definitions.algorithm_specs or data_folder_type not in definitions.algorithm_specs[algo_name]:
+        return RunResources()
+    algo_spec: dict = definitions.algorithm_specs[algo_name][data_folder_type]
+    resources_spec: dict = algo_spec.get('resources',dict()) # structure checked by DefinitionsRegistry.validate()
+    threads = resources_spec.get('threads',1)
+    if isinstance(threads,str):
+        # template referencing 'others' arguments, like '{nb_threads}'
+        values = {argument: arguments.get(argument,spec['default']) for argument, spec in algo_spec['arguments']['others'].items() if 'default' in spec}
+        try:
+            threads = int(threads.format(**values))
+        except ValueError:
+            log.error(f"Cannot deduce the number of threads of '{algo_name}' from '{threads}' and the arguments {values}")
+            exit(1)
+    return RunResources(
+        max(1,threads),
+        float(resources_spec.get('memory_gb',0.0)),
+        resources_spec.get('exclusive',False),
+        resources_spec.get('group',None),
+        resources_spec.get('group_limit',1)
+    )
+
+def get_physical_memory_gb() -> Optional[float]:
+    """
+    Total memory of the machine, in GB. None if unknown
+    """
+    import os
+    try:
+        return os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') / 1e9
+    except (ValueError, OSError, AttributeError):
+        return None
+
+def run_many(algo_name: str, paths: list[Path], arguments_as_list: list = list(), nb_slots: Optional[int] = None, memory_gb: Optional[float] = None, progress: bool = False, timeout: Optional[float] = None) -> list[RunJobResult]:
+    """
+    Execute an algorithm on several data folders concurrently, in a pool of worker processes.
+    Jobs are packed onto `nb_slots` CPU slots (default: number of CPUs) and `memory_gb` GB of memory (default: memory of the machine)
+    according to the resources they declare (see RunResources): each pending job, in order, starts as soon as it fits.
+    Standard output and error of the commands are only written to files. A job failing (return code, exit() or exception) does not stop the others.
+    If `progress`, print a line each time a job ends. `timeout` overwrites the one of the algorithm, see DataFolder.run().
+    Return the results in the order of `paths`
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+    from concurrent.futures.process import BrokenProcessPool
+    if nb_slots is None:
+        nb_slots = os.cpu_count() or 1
+    if memory_gb is None:
+        memory_gb = get_physical_memory_gb() or float('inf')
+    arguments = parse_arguments_list(arguments_as_list)
+    # resources of each job, deduced from the type of its data folder
+    resources: list[RunResources] = list()
+    for path in paths:
+        try:
+            data_folder_type = DataFolder(path).type
+        except (SystemExit, Exception): # the job will fail in its worker, and report why
+            data_folder_type = None
+        resources.append(get_run_resources(algo_name, data_folder_type, arguments))
+        if resources[-1].threads > nb_slots or resources[-1].memory_gb > memory_gb:
+            log.warning(f"Running '{algo_name}' on {path} needs {resources[-1].threads} CPU slots and {resources[-1].memory_gb} GB, more than available ({nb_slots} slots, {memory_gb:.1f} GB): it will run with all of them")
+            resources[-1].threads = min(resources[-1].threads, nb_slots)
+            resources[-1].memory_gb = min(resources[-1].memory_gb, memory_gb)
+    results: list[Optional[RunJobResult]] = [None] * len(paths)
+    console = None
+    if progress:
+        from rich.console import Console
+        console = Console(stderr=True)
+    # resources currently used
+    used_slots: int = 0
+    used_memory_gb: float = 0.0
+    exclusive_running: bool = False
+    running_per_group: dict[str,int] = dict()
+    def fits(job_resources: RunResources, nb_running: int) -> bool:
+        if exclusive_running or (job_resources.exclusive and nb_running != 0):
+            return False
+        if job_resources.group is not None and running_per_group.get(job_resources.group,0) >= job_resources.group_limit:
+            return False
+        return used_slots + job_resources.threads <= nb_slots and used_memory_gb + job_resources.memory_gb <= memory_gb
+    get_definitions() # parsed once, before the workers are forked
+    pending: list[int] = list(range(len(paths)))
+    running: dict[Future,int] = dict()
+    nb_finished: int = 0
+    with ProcessPoolExecutor(max_workers=max(1, min(nb_slots, len(paths)))) as executor:
+        while len(pending) != 0 or len(running) != 0:
+            # start the pending jobs that fit in the available resources (first fit, in order)
+            for index in list(pending):
+                if not fits(resources[index], len(running)):
+                    continue
+                pending.remove(index)
+                running[executor.submit(run_job, paths[index], algo_name, arguments_as_list, timeout)] = index
+                used_slots += resources[index].threads
+                used_memory_gb += resources[index].memory_gb
+                exclusive_running = exclusive_running or resources[index].exclusive
+                if resources[index].group is not None:
+                    running_per_group[resources[index].group] = running_per_group.get(resources[index].group,0) + 1
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                try:
+                    results[index] = future.result()
+                except BrokenProcessPool as e:
+                    results[index] = RunJobResult(paths[index], 'crashed', message=str(e))
+                used_slots -= resources[index].threads
+                used_memory_gb -= resources[index].memory_gb
+                exclusive_running = exclusive_running and not resources[index].exclusive
+                if resources[index].group is not None:
+                    running_per_group[resources[index].group] -= 1
+                notify_folder_modified(paths[index]) # modified by another process
+                nb_finished += 1
+                if console is not None:
+                    console.print(f'\\[{nb_finished}/{len(paths)}] {results[index].status:<7} {collapseuser(paths[index])}', highlight=False)
+    return results
+
+def print_run_many_summary(results: list[RunJobResult]):
+    from rich.console import Console
+    from rich.table import Table
+    STATUS_STYLES = {'done': 'green', 'failed': 'red', 'timeout': 'yellow', 'error': 'red', 'crashed': 'bold red'}
+    table = Table()
+    table.add_column('Folder')
+    table.add_column('Status')
+    table.add_column('Return code', justify='right')
+    table.add_column('Duration', justify='right')
+    table.add_column('Message')
+    for result in results:
+        table.add_row(
+            collapseuser(result.path),
+            f'[{STATUS_STYLES[result.status]}]{result.status}[/]',
+            '' if result.return_code is None else str(result.return_code),
+            '' if result.duration is None else simple_human_readable_duration(result.duration),
+            result.message
+        )
+    console = Console()
+    console.print(table)
+    console.print(', '.join([f'{len([result for result in results if result.status == status])} {status}' for status in RUN_JOB_STATUSES]))
+
+def read_proc_io(pid: int) -> dict[str,int]:
+    """
+    I/O counters of a process, see /proc/<pid>/io in proc(5). Empty if not available (not Linux, or no permission)
+    """
+    try:
+        with open(f'/proc/{pid}/io') as io_file:
+            return {key: int(value) for key, value in [line.split(':') for line in io_file if ':' in line]}
+    except (FileNotFoundError, PermissionError, ValueError):
+        return dict()
+
+LOG_SETTINGS: list[str] = ['max_size','gzip'] # keys of the 'logs' entry of <algo>.yml
+
+class OutputLog():
+    """
+    File receiving the standard output or error of a run, written while the command runs, and removed at close() if nothing was written.
+    If `max_size` (in bytes) is given, only the first and the last `max_size`/2 bytes are kept, with a marker in between:
+    the tail is held in a bounded buffer until close(). If `compress`, the file is gzip-compressed on the fly ('.gz' appended to the filename).
+    The first available filename among `filenames` is used, so that the logs of a previous run are not overwritten.
+    """
+
+    __slots__ = ('folder','filenames','head_size','tail_size','compress','file','filename','written','tail','tail_length','skipped')
+
+    def __init__(self, folder: Path, filenames: list[str], max_size: Optional[int] = None, compress: bool = False):
+        self.folder: Path = folder
+        self.filenames: list[str] = [filename + '.gz' for filename in filenames] if compress else filenames
+        self.head_size: Optional[int] = max_size // 2 if max_size is not None else None
+        self.tail_size: int = max_size - max_size // 2 if max_size is not None else 0
+        self.compress: bool = compress
+        self.file = None
+        self.filename: Optional[str] = None # set by open(), reset by close() if nothing was written
+        self.written: int = 0 # bytes written in the head part
+        self.tail: deque[bytes] = deque() # last chunks, at most `tail_size` bytes + 1 chunk
+        self.tail_length: int = 0
+        self.skipped: int = 0 # bytes dropped between head and tail
+
+    def open(self):
+        """
+        Create the file. To be called before the command starts, in the main thread: an exit() in a reader thread would stop draining the pipe
+        """
+        import gzip
+        for filename in self.filenames:
+            try:
+                self.file = open(self.folder / filename,'xb') # x = create new file
+            except FileExistsError:
+                continue
+            self.filename = filename
+            if self.compress:
+                self.file = gzip.GzipFile(filename=filename, mode='wb', fileobj=self.file)
+            return
+        log.error(f"All of {self.filenames} already exist in {self.folder}")
+        exit(1)
+
+    def write(self, chunk: bytes):
+        if self.head_size is None or self.written < self.head_size:
+            head_part = chunk if self.head_size is None else chunk[0:self.head_size - self.written]
+            self.file.write(head_part)
+            self.written += len(head_part)
+            chunk = chunk[len(head_part):]
+            if len(chunk) == 0:
+                return
+        # keep the last `tail_size` bytes
+        self.tail.append(chunk)
+        self.tail_length += len(chunk)
+        while self.tail_length - len(self.tail[0]) >= self.tail_size:
+            self.skipped += len(self.tail[0])
+            self.tail_length -= len(self.tail.popleft())
+
+    def close(self):
+        if self.file is None:
+            return
+        if self.written == 0 and self.tail_length == 0:
+            # the command wrote nothing in this stream
+            self.discard()
+            return
+        tail = b''.join(self.tail)
+        if len(tail) > self.tail_size:
+            self.skipped += len(tail) - self.tail_size
+            tail = tail[len(tail) - self.tail_size:]
+        if self.skipped != 0:
+            self.file.write(f'\n[... {self.skipped} bytes skipped ...]\n'.encode())
+        self.file.write(tail)
+        raw_file = self.file.fileobj if self.compress else None
+        self.file.close()
+        if raw_file is not None:
+            raw_file.close() # not closed by GzipFile when given as `fileobj`
+        self.file = None
+
+    def discard(self):
+        """
+        Close and remove the file
+        """
+        raw_file = self.file.fileobj if self.compress else None
+        self.file.close()
+        if raw_file is not None:
+            raw_file.close()
+        unlink(self.folder / self.filename)
+        self.file = None
+        self.filename = None
+
+def collect_debug_files(scratch_folder: Path, algo_name: str, debug_files: dict, destination: Path, keep: bool) -> list[str]:
+    """
+    Move (if `keep`) or remove the files written by a run in its working directory `scratch_folder`, then remove `scratch_folder`.
+    Kept files are renamed '<prefix><filename>' in `destination`, the prefix being '<algo_name>.' by default (see 'debug_files' in <algo>.yml).
+    Files not matching the 'patterns' of 'debug_files' are always kept, with a warning: they can be files saved by the user
+    of an interactive algorithm. Return the filenames of the kept files
+    """
+    from shutil import move, rmtree
+    from fnmatch import fnmatch
+    kept_filenames: list[str] = list()
+    undeclared_filenames: list[str] = list()
+    prefix: str = debug_files.get('prefix', algo_name + '.')
+    for entry in sorted(scratch_folder.iterdir()):
+        declared = any([fnmatch(entry.name, pattern) for pattern in debug_files.get('patterns',list())])
+        if keep or not declared:
+            move(entry, destination / (prefix + entry.name))
+            kept_filenames.append(prefix + entry.name)
+            if not declared:
+                undeclared_filenames.append(prefix + entry.name)
+        elif entry.is_dir():
+            rmtree(entry)
+        else:
+            entry.unlink()
+    if len(undeclared_filenames) != 0:
+        log.warning(f"'{algo_name}' wrote files not declared in 'debug_files' in its working directory, moved to {collapseuser(destination)} : {undeclared_filenames}")
+    scratch_folder.rmdir()
+    return kept_filenames
+
+TIMEOUT_GRACE_PERIOD: float = 5.0 # seconds between SIGTERM and SIGKILL, when a command exceeds its timeout
+
+def execute_command(command_line: str, stdout_log: Optional[OutputLog] = None, stderr_log: Optional[OutputLog] = None, tee: bool = True, timeout: Optional[float] = None, cwd: Optional[Path] = None) -> tuple[int,bool,dict]:
+    """
+    Execute a shell command, streaming its standard output and error to `stdout_log` and `stderr_log` (discarded if None)
+    through fixed-size chunks, and to the console if `tee`. Memory does not grow with the amount of output.
+    The command runs in `cwd` (default: the current working directory), in its own process group. After `timeout` seconds, the whole group (shell, `bash -c`, and their subprocesses)
+    receives SIGTERM, then SIGKILL `TIMEOUT_GRACE_PERIOD` seconds later.
+    Return the return code, whether the timeout expired, and the resources used by the command and its subprocesses:
+    user and system CPU time (in seconds), peak resident set size (in bytes), voluntary and involuntary context switches (from os.wait4())
+    and bytes read from/written to the storage layer (from /proc/<pid>/io, Linux only)
+    """
+    import os
+    import signal
+    import subprocess
+    import threading
+    output_logs: list[OutputLog] = [output_log for output_log in [stdout_log, stderr_log] if output_log is not None]
+    try:
+        for output_log in output_logs:
+            output_log.open() # in this thread, see OutputLog.open()
+    except SystemExit:
+        for output_log in output_logs:
+            if output_log.file is not None:
+                output_log.discard()
+        raise
+    process = subprocess.Popen(command_line, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, start_new_session=True, cwd=cwd)
+    def kill_process_group(sig: int):
+        try:
+            os.killpg(process.pid, sig) # the group ID is the PID of the shell, see start_new_session
+        except ProcessLookupError: # the whole group already exited
+            pass
+    finished = threading.Event()
+    timed_out = threading.Event()
+    def watchdog():
+        if finished.wait(timeout):
+            return
+        timed_out.set()
+        kill_process_group(signal.SIGTERM)
+        if not finished.wait(TIMEOUT_GRACE_PERIOD):
+            kill_process_group(signal.SIGKILL)
+    def forward(stream, output_log: Optional[OutputLog], console_stream):
+        console_buffer = getattr(console_stream, 'buffer', None) # binary interface of sys.stdout/sys.stderr, if any
+        while len(chunk := os.read(stream.fileno(), 1 << 16)) != 0:
+            if output_log is not None:
+                output_log.write(chunk)
+            if tee:
+                console_stream.flush()
+                if console_buffer is not None:
+                    console_buffer.write(chunk)
+                    console_buffer.flush()
+                else:
+                    console_stream.write(chunk.decode(errors='replace'))
+        stream.close()
+        if output_log is not None:
+            output_log.close()
+    threads = [
+        threading.Thread(target=forward, args=(process.stdout, stdout_log, sys.stdout)),
+        threading.Thread(target=forward, args=(process.stderr, stderr_log, sys.stderr)),
+    ]
+    for thread in threads:
+        thread.start()
+    if timeout is not None:
+        threading.Thread(target=watchdog, daemon=True).start()
+    try:
+        # the pipes are closed when the shell and its subprocesses exited, or were killed by the watchdog
+        for thread in threads:
+            thread.join()
+        io_counters: dict[str,int] = dict()
+        if hasattr(os,'waitid'):
+            # wait for the termination without reaping the process, so that /proc/<pid>/io still exists.
+            # it includes the I/O of the subprocesses waited by the shell
+            os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)
+            io_counters = read_proc_io(process.pid)
+    except KeyboardInterrupt:
+        # in its own process group, the command does not receive the SIGINT of the terminal
+        kill_process_group(signal.SIGKILL)
+        raise
+    finally:
+        finished.set()
+    _, wait_status, rusage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(wait_status) # already reaped, Popen must not wait for it
+    resources = {
+        'user_time': rusage.ru_utime,
+        'system_time': rusage.ru_stime,
+        'max_rss': rusage.ru_maxrss * (1 if sys.platform == 'darwin' else 1024), # kilobytes on Linux, bytes on macOS
+        'voluntary_context_switches': rusage.ru_nvcsw,
+        'involuntary_context_switches': rusage.ru_nivcsw,
+    }
+    if 'read_bytes' in io_counters:
+        resources['read_bytes'] = io_counters['read_bytes']
+        resources['write_bytes'] = io_counters['write_bytes']
+    return process.returncode, timed_out.is_set(), resources
+
+class Executable():
+    """
+    Executable referenced by views and algorithms (path keyword of paths.yml + optional filename),
+    resolved and stat-ed once per process, see get_executable()
+    """
+
+    __slots__ = ('path','size','mtime_ns','sha256')
+
+    def __init__(self, path: Path):
+        self.path: Path = path
+        stat = path.stat()
+        self.size: int = stat.st_size
+        self.mtime_ns: int = stat.st_mtime_ns
+        self.sha256: Optional[str] = None # computed on demand, see fingerprint()
+
+    def fingerprint(self, with_hash: Optional[bool] = None) -> dict:
+        """
+        Cheap identification of the binary (size and modification time).
+        The SHA-256 of its content is added if `with_hash`, by default if the DDS_HASH_EXECUTABLES environment variable is set to 1.
+        """
+        if with_hash is None:
+            with_hash = environ.get('DDS_HASH_EXECUTABLES','0') == '1'
+        fingerprint = {
+            'path': str(self.path),
+            'size': self.size,
+            'mtime': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(self.mtime_ns // 1000000000)) + f'.{self.mtime_ns // 1000 % 1000000:06d}Z' # UTC, same format as info.json keys (see new_run_id())
+        }
+        if with_hash and self.path.is_file():
+            if self.sha256 is None:
+                import hashlib
+                sha256 = hashlib.sha256()
+                with open(self.path,'rb') as binary_file:
+                    while chunk := binary_file.read(1 << 20):
+                        sha256.update(chunk)
+                self.sha256 = sha256.hexdigest()
+            fingerprint['sha256'] = self.sha256
+        return fingerprint
+
+_executables: dict[tuple[str,Optional[str]],Executable] = dict() # (path keyword, filename) -> Executable, see get_executable()
+
+def get_executable(executable_definition: dict, YAML_filepath: Path) -> Executable:
+    """
+    Resolve the 'executable' entry of a view or an algorithm, once per process.
+    Exit with failure if its path keyword is not in definitions/paths.yml, or if the executable does not exist.
+    Checked here and not when parsing definitions/, so that commands which do not execute anything work without a complete paths.yml.
+    """
+    path_keyword: str = executable_definition['path']
+    executable_filename: Optional[str] = executable_definition.get('filename',None)
+    if (path_keyword,executable_filename) in _executables:
+        return _executables[(path_keyword,executable_filename)]
+    paths = get_definitions().paths
+    if path_keyword not in paths:
+        log.error(f"'{path_keyword}' is referenced in {YAML_filepath} at 'executable/path' but does not exist in definitions/paths.yml")
+        exit(1)
+    executable_path: Path = Path(paths[path_keyword]).expanduser()
+    if not executable_path.exists():
+        log.error(f"In paths.yml, '{path_keyword}' reference a non existing path, required by {YAML_filepath} algorithm")
+        log.error(f"({executable_path})")
+        exit(1)
+    if executable_filename is not None:
+        executable_path = executable_path / executable_filename
+        if not executable_path.exists():
+            log.error(f"There is no {executable_filename} in {paths[path_keyword]}. Required by {YAML_filepath} algorithm")
+            exit(1)
+    _executables[(path_keyword,executable_filename)] = Executable(executable_path.absolute()) # algorithms are executed in another working directory
+    return _executables[(path_keyword,executable_filename)]
+
+_generation_plans: dict[tuple[str,str],str] = dict() # (absolute data folder path, missing filename keyword) -> algorithm to run, see DataFolder.plan_missing_file_generation()
+
+_ancestor_chains: dict[str,tuple[Path,list[tuple[Path,int]],dict[str,DataFolder],Path]] = dict() # absolute folder path -> (folder path as given, ancestors and their modification time in ns, closest ancestor of each type, first non-instantiable ancestor), see get_ancestor_chain()
+_ancestor_chains_paths: SortedPaths = SortedPaths() # keys of _ancestor_chains
+
+def get_ancestor_chain(path: Path) -> tuple[dict[str,DataFolder],Path]:
+    """
+    Closest data folder of each type among the ancestors of `path`, up to the first non-instantiable ancestor (also returned).
+    Memoized per folder. The type of an ancestor only depends on its content, so the chain is valid as long as the modification times of the
+    visited ancestors did not change: revalidation costs a stat() per ancestor, instead of a type inference and an instantiation.
+    """
+    key = abspath(path)
+    cached = _ancestor_chains.get(key,None)
+    if cached is not None and cached[0] == path: # else the ancestors would be in another form (relative/absolute) than `path`
+        _, ancestors_mtime_ns, closest_of_type, first_non_instantiable = cached
+        try:
+            if all(stat(ancestor).st_mtime_ns == mtime_ns for ancestor, mtime_ns in ancestors_mtime_ns):
+                return closest_of_type, first_non_instantiable
+        except FileNotFoundError:
+            pass
+    ancestors_mtime_ns = list()
+    closest_of_type = dict()
+    ancestor = path.parent
+    while True:
+        try:
+            ancestors_mtime_ns.append((ancestor,stat(ancestor).st_mtime_ns))
+            data_folder = DataFolder(ancestor)
+        except (FileNotFoundError, DataFolderInstantiationError):
+            break
+        closest_of_type.setdefault(data_folder.type,data_folder)
+        if ancestor.parent == ancestor: # '/' or '.'
+            break
+        ancestor = ancestor.parent
+    _ancestor_chains[key] = (path, ancestors_mtime_ns, closest_of_type, ancestor)
+    _ancestor_chains_paths.add(key)
+    return closest_of_type, ancestor
+
+DATA_FOLDER_CACHE_SIZE: int = 65536 # maximal number of DataFolder instances kept by DataFolder.__new__()
+
+_data_folders: OrderedDict[str,DataFolder] = OrderedDict() # absolute path -> shared instance, least recently used first, see DataFolder.__new__()
+_data_folders_paths: SortedPaths = SortedPaths() # keys of _data_folders
+
+def notify_folder_modified(path: Path):
+    """
+    Invalidate what is cached about a folder and the folders below, to be called after creating or modifying folders
+    (done by DataFolder.run()). The next DataFolder(path) will infer the type again, info.json files will be parsed again,
+    ancestor chains and generation plans will be computed again.
+    """
+    key = abspath(path)
+    for cached_path in _data_folders_paths.pop_subtree(key):
+        _data_folders.pop(cached_path,None)
+    for cached_path in _ancestor_chains_paths.pop_subtree(key):
+        _ancestor_chains.pop(cached_path,None)
+    with _info_dicts_lock: # _info_dicts is also modified by compaction threads
+        for cached_path in _info_dicts_paths.pop_subtree(key):
+            _info_dicts.pop(cached_path,None)
+    prefix = key + '/'
+    for plan_key in [plan_key for plan_key in _generation_plans.keys() if plan_key[0] == key or plan_key[0].startswith(prefix)]: # few entries
+        del _generation_plans[plan_key]
+
+class DataFolderInstantiationError(Exception):
+    """
+    Exception raised for attempted DataFolder instantiation on a folder whose type cannot be inferred
+    """
+    def __init__(self, path):
+        self.path = path
+        super().__init__(f'No definitions/data_folder_type/* recognize {collapseuser(self.path)}')
+
+class DataFolder():
+    """
+    Instantiating a DataFolder returns an instance of the subclass dedicated to its type,
+    see get_data_folder_class().
+    Instances are shared: DataFolder(path) returns the same object while `path` stays in the LRU cache
+    (DATA_FOLDER_CACHE_SIZE instances at most) and has not been invalidated by notify_folder_modified().
+    """
+
+    __slots__ = ('path','type')
+
+    def __new__(cls, path: Path):
+        path = Path(path) # in case the argument was a str
+        key = abspath(path) # relative and absolute paths of a folder share the same entry
+        cached = _data_folders.get(key,None)
+        if cached is not None:
+            _data_folders.move_to_end(key)
+            if cached.path == path:
+                return cached
+            # same folder, given in another form (relative/absolute): reuse the inferred type, but keep `path` as given
+            instance = object.__new__(type(cached))
+            instance.path = path
+            instance.type = cached.type
+            return instance
+        data_folder_type: Optional[str] = type_inference(path)
+        if data_folder_type is None:
+            raise DataFolderInstantiationError(path)
+        instance = object.__new__(get_data_folder_class(data_folder_type))
+        instance.path = path
+        instance.type = data_folder_type
+        _data_folders[key] = instance
+        _data_folders_paths.add(key)
+        if len(_data_folders) > DATA_FOLDER_CACHE_SIZE:
+            evicted_key, _ = _data_folders.popitem(last=False) # evict the least recently used
+            _data_folders_paths.discard(evicted_key)
+        return instance
+
+    def __str__(self) -> str:
+        return f"DataFolder('{self.path}','{self.type}')"
+    
+    def __repr__(self) -> str:
+        return f"DataFolder(path='{self.path}',type='{self.type}')"
+    
+    def get_info_dict(self) -> Optional[dict]:
+        # shared with the other readers of this info.json, see load_info_dict()
+        return load_info_dict(self.path)
+        
+    def get_datetime_key_of_algo_in_info_file(self, algo_name: str) -> Optional[str]:
+        return get_datetime_key_of_algo_in_info_file(self.path, algo_name)
+        
+    def get_subfolders_of_type(self, data_folder_type: str, from_index: bool = False) -> list[Path]:
+        return get_subfolders_of_type(self.path, data_folder_type, from_index)
+    
+    def get_subfolders_generated_by(self, generator_name: str, from_index: bool = False) -> list[Path]:
+        return get_subfolders_generated_by(self.path, generator_name, from_index)
+    
+    def print_history(self):
+        # plain text: importing rich for a table would take most of the startup time of `dds.py history` (see benchmarks/startup.py)
+        rows: list[tuple[str,str]] = [('Datetime','Name')]
+        info_dict = self.get_info_dict()
+        assert(info_dict is not None)
+        for datetime, algo_info in info_dict.items(): # for each top-level entry in info.json
+            datetime = ISO_datetime_to_readable_datetime(datetime)
+            algo_name = '?'
+            if 'GenerativeAlgorithm' in algo_info:
+                algo_name = algo_info['GenerativeAlgorithm']
+            elif 'InteractiveGenerativeAlgorithm' in algo_info:
+                algo_name = algo_info['InteractiveGenerativeAlgorithm']
+            elif 'TransformativeAlgorithm' in algo_info:
+                algo_name = algo_info['TransformativeAlgorithm']
+            rows.append((datetime,algo_name))
+        datetime_width = max([len(datetime) for datetime, _ in rows])
+        sys.stdout.write(''.join([f'{datetime:<{datetime_width}}  {algo_name}\n' for datetime, algo_name in rows])) # not print(), which is rich.print()
+    
+    def list_children(self, type_filter: Optional[list[str]] = None, algo_filter: Optional[list[str]] = None, recursive: bool = False, from_index: bool = False) -> list:
+        return list_children(self.path,type_filter,algo_filter,recursive,from_index)
+    
+    def print_children(self, type_filter: Optional[list[str]] = None, algo_filter: Optional[list[str]] = None, recursive: bool = False, parent_tree: Optional[Tree] = None, max_depth: Optional[int] = None):
+        print_children(self.path,type_filter,algo_filter,recursive,parent_tree,max_depth)
+        
+    def plan_missing_file_generation(self, filename_keyword: str, being_planned: list[tuple[str,str]]) -> tuple[Optional[str],bool]:
+        """
+        Find a transformative non-parametric algorithm able to write the missing file `filename_keyword`,
+        possibly after the recursive generation of its own missing input files.
+        Return the algorithm name (None if there is no solution), and whether a dependency cycle was cut during the search.
+        """
+        key = (abspath(self.path), filename_keyword)
+        if key in _generation_plans:
+            return _generation_plans[key], False
+        if key in being_planned:
+            log.debug(f"plan_missing_file_generation('{filename_keyword}') on {self.path} : dependency cycle")
+            return None, True
+        being_planned.append(key)
+        solution: Optional[str] = None
+        cycle_cut: bool = False
+        definitions = get_definitions()
+        for algo_name in definitions.producers.get(self.type,dict()).get(filename_keyword,list()):
+            log.debug(f"plan_missing_file_generation('{filename_keyword}') on {self.path} : checking algo '{algo_name}'")
+            all_inputs_can_exist = True
+            for input_filename_keyword in definitions.algorithm_specs[algo_name][self.type]['arguments']['input_files'].values():
+                _, its_data_folder_type = translate_filename_keyword(input_filename_keyword)
+                input_data_folder: DataFolder = self.get_closest_parent_of_type(its_data_folder_type)
+                if input_data_folder.get_file(input_filename_keyword, must_exist=False).exists():
+                    continue
+                input_solution, input_cycle_cut = input_data_folder.plan_missing_file_generation(input_filename_keyword, being_planned)
+                cycle_cut = cycle_cut or input_cycle_cut
+                if input_solution is None:
+                    all_inputs_can_exist = False
+                    break
+            if all_inputs_can_exist:
+                solution = algo_name
+                break
+        being_planned.pop()
+        if solution is not None:
+            # failures are not memoized: they can come from a cut cycle, or from an input file that will be written later
+            _generation_plans[key] = solution
+        return solution, cycle_cut
+
+    def auto_generate_missing_file(self, filename_keyword: str, silent_output: bool = False):
+        # Find a transformative non-parametric algorithm writing 'filename_keyword' (see DefinitionsRegistry.producers),
+        # generate its missing input files (recursive calls through get_file()), then execute it
+        algo_name, cycle_cut = self.plan_missing_file_generation(filename_keyword, list())
+        if algo_name is None:
+            log.fatal(f"auto_generate_missing_file('{filename_keyword}') on {self.path} : no solution found" + (" (dependency cycle between algorithms)" if cycle_cut else ""))
+            exit(1)
+        for input_filename_keyword in get_definitions().algorithm_specs[algo_name][self.type]['arguments']['input_files'].values():
+            _, its_data_folder_type = translate_filename_keyword(input_filename_keyword)
+            self.get_closest_parent_of_type(its_data_folder_type).get_file(input_filename_keyword, must_exist=True, silent_output=silent_output)
+        log.debug(f"auto_generate_missing_file('{filename_keyword}') on {self.path} : the solution found is to run {algo_name}")
+        self.run(algo_name, silent_output=silent_output)
+        
+    def get_file(self, filename_keyword: str, must_exist: bool = False, silent_output: bool = False) -> Path:
+        # transform filename keyword into actual filename with the definition of the data folder type
+        assert(self.type is not None)
+        filenames: dict = get_definitions().data_folder_types[self.type]['filenames']
+        if filename_keyword not in filenames:
+            log.error(f"definitions/data_folder_types/{self.type}.yml has no 'filenames'/'{filename_keyword}' entry")
+            exit(1)
+        path = (self.path / filenames[filename_keyword]).absolute()
+        if (not must_exist) or (must_exist and path.exists()):
+            return path
+        log.debug(f"get_file('{filename_keyword}',{must_exist}) on {self.path} : launching auto_generate_missing_file()")
+        self.auto_generate_missing_file(filename_keyword, silent_output=silent_output)
+        if path.exists():
+            return path # successful auto-generation
+        raise FileNotFoundError(f'Missing file {path}')
+
+    def get_closest_parent_of_type(self, data_folder_type: str, check_self = True):
+        if check_self and self.type == data_folder_type:
+            return self
+        closest_of_type, first_non_instantiable = get_ancestor_chain(self.path)
+        if data_folder_type not in closest_of_type:
+            log.error(f'get_closest_parent_of_type() found a non-instantiable parent folder ({first_non_instantiable}) before one of the requested folder type ({data_folder_type})')
+            exit(1)
+        return closest_of_type[data_folder_type]
+    
+    def view(self, view_name: Optional[str] = None):
+        from rich.console import Console
+        from rich.rule import Rule
+        import subprocess_tee
+        assert(self.type is not None)
+        if view_name is None:
+            view_name = get_default_view_name(self.type)
+            if view_name is None:
+                log.fatal(f"view() on {self.path} was called without a view name, and data folder type '{self.type}' does not specify a default view name")
+                exit(1)
+        YAML_filepath: Path = Path('definitions/data_folder_types') / (self.type + '.' + view_name + '.yml')
+        definitions = get_definitions()
+        if view_name not in definitions.views.get(self.type,dict()):
+            log.error(f"Cannot use view '{view_name}' on a data folder of type {self.type} because {YAML_filepath} does not exist")
+            exit(1)
+        YAML_content: dict = definitions.views[self.type][view_name] # structure checked by DefinitionsRegistry.validate()
+        # retrieve info about underlying executable
+        command_line: str = YAML_content['executable']['command_line']
+        executable_path: Path = get_executable(YAML_content['executable'],YAML_filepath).path
+        log.info(f"View '{view_name}' on a data folder of type {self.type} -> executing {executable_path}")
+        # assemble dict of 'others' arguments
+        all_arguments = dict()
+        # add 'input_files' and 'other' arguments to the 'all_arguments' dict
+        for input_file_argument, input_filename_keyword in YAML_content['arguments']['input_files'].items():
+            log.debug(f"view('{view_name}') on {self.path} : the algorithm wants a {input_filename_keyword} as input")
+            _, its_data_folder_type = translate_filename_keyword(input_filename_keyword)
+            log.debug(f"view('{view_name}') on {self.path} : ⤷ we must look into a (parent) folder of type '{its_data_folder_type}'")
+            closest_parent_of_this_type: DataFolder = self.get_closest_parent_of_type(its_data_folder_type,True)
+            log.debug(f"view('{view_name}') on {self.path} : ⤷ the closest is {closest_parent_of_this_type.path}")
+            input_file_path = closest_parent_of_this_type.get_file(input_filename_keyword, True)
+            all_arguments[input_file_argument] = input_file_path
+        if 'others' in YAML_content['arguments']:
+            for other_argument in YAML_content['arguments']['others']:
+                # only accepts constant adjacent filename into 'others' arguments
+                adj_file: Path = YAML_filepath.parent / YAML_content['arguments']['others'][other_argument]['adjacent_file']
+                assert(adj_file.exists())
+                all_arguments[other_argument] = str(adj_file.absolute())
+        command_line = f'{executable_path} {command_line.format(**all_arguments)}'
+        if 'prefix' in YAML_content['executable']:
+            command_line = YAML_content['executable']['prefix'] + ' ' + command_line
+        # execution
+        console = Console()# execute the command line
+        console.print(Rule(f'beginning of [magenta]{collapseuser(executable_path)}'))
+        subprocess_tee.run(command_line, shell=True, capture_output=True, tee=True)
+        console.print(Rule(f'end of [magenta]{collapseuser(executable_path)}'))
+    
+    def execute_algo_preprocessing(self, console: Console, algo_name: str, output_subfolder: Optional[Path], arguments: dict, silent_output: bool) -> dict:
+        from rich.rule import Rule
+        script_filepath: Optional[Path] = get_definitions().hooks.get(algo_name,dict()).get('pre',None)
+        if script_filepath is None:
+            return dict() # no preprocessing defined for this algorithm
+        ext_module = load_Python_module(script_filepath)
+        if not silent_output:
+            console.print(Rule(f'beginning of {script_filepath.name} pre_processing()'))
+        data_from_preprocessing = ext_module.pre_processing(self,output_subfolder,arguments,silent_output)
+        if not silent_output:
+            console.print(Rule(f'end of {script_filepath.name} pre_processing()'))
+        return data_from_preprocessing
+    
+    def execute_algo_postprocessing(self, console: Console, algo_name: str, output_subfolder: Optional[Path], arguments: dict, data_from_preprocessing: dict, silent_output: bool):
+        from rich.rule import Rule
+        script_filepath: Optional[Path] = get_definitions().hooks.get(algo_name,dict()).get('post',None)
+        if script_filepath is None:
+            return # no postprocessing defined for this algorithm
+        # import the module containing the post_processing() function
+        ext_module = load_Python_module(script_filepath)
+        if not silent_output:
+            console.print(Rule(f'beginning of {script_filepath.name} post_processing()'))
+        if output_subfolder is None: # post-processing of a transformative algorithme
+            ext_module.post_processing(self,arguments,data_from_preprocessing,silent_output)
+        else: # post-processing of a generative algorithm
+            ext_module.post_processing(self,output_subfolder,arguments,data_from_preprocessing,silent_output)
+        if not silent_output:
+            console.print(Rule(f'end of {script_filepath.name} post_processing()'))
+
+    def run(self, algo_name: str, arguments: dict = dict(), silent_output: bool = False, timeout: Optional[float] = None) -> dict:
+        """
+        Execute an algorithm defined in definitions/algorithms/ on this data folder. Return the entry added to info.json.
+        The command is killed after `timeout` seconds, by default the 'timeout' of the algorithm definition (none if missing, or if `timeout` is 0)
+        """
+        from tempfile import mkdtemp
+        from shutil import rmtree
+        from rich.console import Console
+        from rich.rule import Rule
+        YAML_filepath: Path = Path('definitions/algorithms') / (algo_name + '.yml')
+        definitions = get_definitions()
+        if algo_name not in definitions.algorithm_specs:
+            log.error(f"Cannot run '{algo_name}' because {YAML_filepath} does not exist")
+            exit(1)
+        if self.type not in definitions.algorithm_specs[algo_name]:
+            log.error(f"Behavior of {YAML_filepath} is not specified for input data folders of type '{self.type}', like {self.path} is")
+            exit(1)
+        algo_spec: dict = definitions.algorithm_specs[algo_name][self.type] # structure checked by DefinitionsRegistry.validate()
+        if timeout is None:
+            timeout = definitions.algorithms[algo_name].get('timeout',None)
+        elif timeout <= 0:
+            timeout = None
+        # retrieve info about underlying executable
+        command_line: str = algo_spec['executable']['command_line']
+        executable: Executable = get_executable(algo_spec['executable'],YAML_filepath)
+        executable_path: Path = executable.path
+        log.info(f"Running '{algo_name}' -> executing {executable_path}")
+        # assemble dict of 'others' arguments
+        all_arguments = dict()
+        if 'others' in algo_spec['arguments']:
+            for other_argument in algo_spec['arguments']['others']:
+                # there are 2 kind of other arguments
+                # - a setting, whose default value can be overwritten from the command line
+                # - a constant adjacent filename
+                if 'default' in algo_spec['arguments']['others'][other_argument]:
+                    all_arguments[other_argument] = algo_spec['arguments']['others'][other_argument]['default']
+                    # infer argument data type from default value
+                    data_type = type(all_arguments[other_argument])
+                    if other_argument in arguments:
+                        # overwrite default value with user-given value
+                        if data_type == bool:
+                            # thank Keith Gaughan https://stackoverflow.com/a/715455
+                            all_arguments[other_argument] = arguments[other_argument].lower() in ['true', '1', 't', 'y', 'yes']
+                        else:
+                            all_arguments[other_argument] = data_type(arguments[other_argument])
+                        arguments.pop(other_argument)
+                else: # 'adjacent_file', see DefinitionsRegistry.validate()
+                    adj_file: Path = YAML_filepath.parent / algo_spec['arguments']['others'][other_argument]['adjacent_file']
+                    assert(adj_file.exists())
+                    all_arguments[other_argument] = str(adj_file.absolute())
+        if len(arguments):
+            log.warning(f'Some arguments given to run() are not used by the algorithm : {list(arguments.keys())}')
+        # get current date and time, to the microsecond
+        start_datetime_iso, start_datetime_filesystem = new_run_id()
+        # find out if it's a transformative or a generative algorithm (edit a DataFolder or create a sub-DataFolder)
+        output_folder_path: Optional[Path] = None
+        if 'output_folder' in algo_spec:
+            output_folder_template = algo_spec['output_folder'].format(**all_arguments)
+            while True:
+                output_folder_path = self.path / output_folder_template.replace('%d',start_datetime_filesystem)
+                try:
+                    mkdir(output_folder_path)
+                    break
+                except FileExistsError:
+                    if '%d' not in output_folder_template:
+                        log.error(f"The output folder to create ({output_folder_path}) already exists")
+                        exit(1)
+                    # created by another process in the same microsecond -> get a new identifier
+                    start_datetime_iso, start_datetime_filesystem = new_run_id()
+            command_line = command_line.replace(r'{output_folder}',str(output_folder_path.absolute()))
+        # add 'input_files' and 'output_files' arguments to the 'all_arguments' dict
+        for input_file_argument, input_filename_keyword in algo_spec['arguments']['input_files'].items():
+            log.debug(f"run('{algo_name}',...) on {self.path} : the algorithm wants a {input_filename_keyword} as input")
+            _, its_data_folder_type = translate_filename_keyword(input_filename_keyword)
+            log.debug(f"run('{algo_name}',...) on {self.path} : ⤷ we must look into a (parent) folder of type '{its_data_folder_type}'")
+            closest_parent_of_this_type: DataFolder = self.get_closest_parent_of_type(its_data_folder_type,True)
+            log.debug(f"run('{algo_name}',...) on {self.path} : ⤷ the closest is {closest_parent_of_this_type.path}")
+            input_file_path = closest_parent_of_this_type.get_file(input_filename_keyword, must_exist=True, silent_output=silent_output)
+            all_arguments[input_file_argument] = input_file_path.absolute() # the command is executed in a scratch working directory
+        if 'output_files' in algo_spec['arguments']:
+            for output_file_argument in algo_spec['arguments']['output_files']:
+                output_file_path = None
+                if output_folder_path is None: # case transformative algorithm, no output folder created
+                    output_file_path = self.get_file(algo_spec['arguments']['output_files'][output_file_argument], must_exist=False, silent_output=silent_output)
+                else: # case generative algorithm
+                    output_file_path = output_folder_path / translate_filename_keyword(algo_spec['arguments']['output_files'][output_file_argument])[0]
+                all_arguments[output_file_argument] = output_file_path.absolute()
+        command_line = f'{executable_path} {command_line.format(**all_arguments)}'
+        if 'prefix' in algo_spec['executable']:
+            command_line = algo_spec['executable']['prefix'] + ' ' + command_line
+        # fill the info.json entry, appended to the journal of the folder at the end (see append_info_entry())
+        info_file_path = self.path / 'info.json' if output_folder_path is None else output_folder_path / 'info.json'
+        info_entry = {
+            'TransformativeAlgorithm' if output_folder_path is None else 'GenerativeAlgorithm': algo_name,
+            'command': command_line,
+            'executable': executable.fingerprint(),
+            'parameters': dict()
+        }
+        for k,v in all_arguments.items():
+            info_entry['parameters'][k] = str(v)
+        console = Console()
+        if not silent_output:
+            if 'note' in algo_spec:
+                console.print(algo_spec['note'].format(**all_arguments))
+        # execution
+        def core_of_the_function():
+            # execute preprocessing
+            data_from_preprocessing = self.execute_algo_preprocessing(console,algo_name,output_folder_path,all_arguments,silent_output)
+            # execute the command line
+            if not silent_output:
+                console.print(Rule(f'beginning of [magenta]{collapseuser(executable_path)}'))
+            chrono_start = time.monotonic()
+            # stream stdout and stderr to files, possibly capped and compressed (see 'logs' in the algorithm definition)
+            log_settings: dict = definitions.algorithms[algo_name].get('logs',dict())
+            output_logs: dict[str,OutputLog] = {
+                stream_name: OutputLog(
+                    self.path if output_folder_path is None else output_folder_path,
+                    [f'{algo_name}.{stream_name}.txt', f'{algo_name}.{start_datetime_filesystem}.{stream_name}.txt'],
+                    log_settings.get('max_size',None),
+                    log_settings.get('gzip',False)
+                ) for stream_name in ['stdout','stderr']
+            }
+            # private working directory, so that concurrent runs do not mix the files they write in it
+            scratch_folder = Path(mkdtemp(prefix=f'dds.{algo_name}.'))
+            try:
+                return_code, timed_out, resources = execute_command(command_line, output_logs['stdout'], output_logs['stderr'], tee=(not silent_output), timeout=timeout, cwd=scratch_folder)
+                chrono_stop = time.monotonic()
+                if not silent_output:
+                    console.print(Rule(f'end of [magenta]{collapseuser(executable_path)}'))
+                # move or remove the debug files, according to the 'keep_debug_files' argument (see 'debug_files' in the algorithm definition)
+                kept_debug_files = collect_debug_files(
+                    scratch_folder,
+                    algo_name,
+                    definitions.algorithms[algo_name].get('debug_files',dict()),
+                    self.path if output_folder_path is None else output_folder_path,
+                    all_arguments.get('keep_debug_files',False)
+                )
+            finally:
+                rmtree(scratch_folder, ignore_errors=True) # if the command or collect_debug_files() was interrupted
+            if len(kept_debug_files) != 0:
+                info_entry['debug_files'] = kept_debug_files
+            # reference stdout and stderr files
+            for stream_name, output_log in output_logs.items():
+                if output_log.filename is not None: # if the subprocess wrote something in this stream
+                    info_entry[stream_name] = output_log.filename
+                    if output_log.skipped != 0:
+                        info_entry[f'{stream_name}_skipped_bytes'] = output_log.skipped
+            # store return code, duration and used resources
+            info_entry['return_code'] = return_code
+            duration = chrono_stop - chrono_start
+            info_entry['duration'] = [duration, simple_human_readable_duration(duration)]
+            info_entry.update(resources)
+            if timed_out:
+                info_entry['status'] = 'timeout'
+                info_entry['timeout'] = timeout
+            # append the entry to the journal of info.json (no read-modify-write of info.json, in case of concurrent runs on the same folder)
+            append_info_entry(info_file_path.parent, start_datetime_iso, info_entry)
+            if timed_out:
+                log.warning(f"'{algo_name}' on {self.path} was killed after {simple_human_readable_duration(timeout)} (timeout), post-processing skipped")
+                return
+            # execute postprocessing
+            self.execute_algo_postprocessing(console,algo_name,output_folder_path,all_arguments,data_from_preprocessing,silent_output)
+        try:
+            if silent_output:
+                # no rich.status, no spinner
+                core_of_the_function()
+            else:
+                with console.status(f'Executing [bold yellow]{algo_name}[/] on [bold cyan]{collapseuser(self.path)}[/]...') as status:
+                    core_of_the_function()
+        finally:
+            # the algorithm and its hooks may have created, modified or removed files and folders
+            notify_folder_modified(self.path)
+        return info_entry
+           
+
+def load_folder_records(path: Path, data_folder_type: Optional[str]) -> tuple[dict,dict[str,float]]:
+    """
+    Content of the info.json of a folder (empty if missing) and the numbers of its existing *_STATS_JSON files,
+    keyed by '<filename keyword>.<dot-separated keys>'. Missing stats files are not computed.
+    Does not use the shared info.json cache, to be callable from several threads.
+    """
+    info_dict = read_info_dict(path) or dict()
+    stats: dict[str,float] = dict()
+    if data_folder_type is not None:
+        for filename_keyword, filename in get_definitions().data_folder_types[data_folder_type]['filenames'].items():
+            if not filename_keyword.endswith('_STATS_JSON') or not (path / filename).exists():
+                continue
+            with open(path / filename) as stats_file:
+                stats.update(flatten_numeric_values(json.load(stats_file), filename_keyword))
+    return info_dict, stats
+
+class DataFolderSet():
+    """
+    Data folders below a root folder, optionally filtered by type and generative algorithm,
+    with columnar access (NumPy arrays, one value per folder) to their stats and to the metadata of their runs:
+
+        dfs = DataFolderSet(Path('~/data').expanduser(), type_filter=['hex-mesh'])
+        min_SJ = dfs.stats('cells.quality.hex_SJ.min') # NaN for folders without this value
+        invalid = dfs.subset(min_SJ < 0)
+
+    info.json and stats files are read in bulk by a thread pool on first access, then cached in the set.
+    """
+
+    def __init__(self, root: Path, type_filter: Optional[list[str]] = None, algo_filter: Optional[list[str]] = None, nb_threads: Optional[int] = None, _children: Optional[list[tuple[Path,Optional[str],Optional[str]]]] = None):
+        self.root: Path = root
+        self.nb_threads: Optional[int] = nb_threads
+        self.children: list[tuple[Path,Optional[str],Optional[str]]] = _children if _children is not None else list_children(root,type_filter,algo_filter,recursive=True)
+        self._records: Optional[list[tuple[dict,dict[str,float]]]] = None # per folder, see load_folder_records()
+        self._stats_keys: Optional[set[str]] = None # union of the stats keys of all folders
+
+    def __len__(self) -> int:
+        return len(self.children)
+
+    def __iter__(self) -> Iterator[DataFolder]:
+        for path, _, _ in self.children:
+            yield DataFolder(path)
+
+    def __repr__(self) -> str:
+        return f"DataFolderSet(root='{self.root}',{len(self)} folders)"
+
+    @property
+    def paths(self) -> list[Path]:
+        return [path for path, _, _ in self.children]
+
+    @property
+    def types(self) -> np.ndarray:
+        import numpy as np
+        return np.array([type_str for _, type_str, _ in self.children], dtype=object)
+
+    @property
+    def generative_algorithms(self) -> np.ndarray:
+        import numpy as np
+        return np.array([algo_str for _, _, algo_str in self.children], dtype=object)
+
+    def subset(self, mask) -> DataFolderSet:
+        """
+        Folders for which `mask` (boolean array, one value per folder) is true. Already loaded records are kept.
+        """
+        subset = DataFolderSet(self.root, nb_threads=self.nb_threads, _children=[child for child, keep in zip(self.children,mask) if keep])
+        if self._records is not None:
+            subset._records = [record for record, keep in zip(self._records,mask) if keep]
+        return subset
+
+    def load(self, force: bool = False) -> list[tuple[dict,dict[str,float]]]:
+        """
+        Read the info.json and stats files of all folders, in parallel. Done once, unless `force`
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        if self._records is None or force:
+            get_definitions() # load the definitions before spawning threads
+            with ThreadPoolExecutor(self.nb_threads) as executor:
+                self._records = list(executor.map(load_folder_records, self.paths, [type_str for _, type_str, _ in self.children]))
+            self._stats_keys = None
+        return self._records
+
+    def stats_keys(self) -> list[str]:
+        """
+        All stats available in at least one folder, as '<filename keyword>.<dot-separated keys>'
+        """
+        if self._stats_keys is None:
+            self._stats_keys = set().union(*[stats.keys() for _, stats in self.load()])
+        return sorted(self._stats_keys)
+
+    def resolve_stats_key(self, name: str) -> str:
+        """
+        Full key of a stats value given by its last keys, like 'hex_SJ.min' for 'HEX_MESH_STATS_JSON.cells.quality.hex_SJ.min'
+        """
+        candidates = [key for key in self.stats_keys() if key == name or key.endswith('.' + name)]
+        if len(candidates) == 0:
+            log.error(f"No stats named '{name}' in the {len(self)} folders")
+            exit(1)
+        if len(candidates) > 1:
+            log.error(f"Ambiguous stats name '{name}', candidates are {candidates}")
+            exit(1)
+        return candidates[0]
+
+    def stats(self, name: str) -> np.ndarray:
+        """
+        Value of a stats for each folder, NaN where missing. See resolve_stats_key() for `name`
+        """
+        import numpy as np
+        key = self.resolve_stats_key(name)
+        return np.array([stats.get(key,np.nan) for _, stats in self.load()], dtype=np.float64)
+
+    def run_metadata(self, field: str, algo_name: Optional[str] = None) -> np.ndarray:
+        """
+        A field of the info.json entry of each folder, NaN where missing.
+        The entry is the first run of `algo_name` if given, else the generative one.
+        'duration' is given in seconds.
+        """
+        import numpy as np
+        values = list()
+        for info_dict, _ in self.load():
+            value = np.nan
+            for algo_info in info_dict.values():
+                if (algo_name is None and ('GenerativeAlgorithm' in algo_info or 'InteractiveGenerativeAlgorithm' in algo_info)) or \
+                   (algo_name is not None and algo_name in [algo_info.get(kind,None) for kind in RUN_KINDS]):
+                    value = algo_info.get(field,np.nan)
+                    if field == 'duration' and isinstance(value,list):
+                        value = value[0] # [seconds, human readable]
+                    break
+            values.append(value)
+        return np.array(values, dtype=np.float64)
+
+    def durations(self, algo_name: Optional[str] = None) -> np.ndarray:
+        return self.run_metadata('duration', algo_name)
+
+    def return_codes(self, algo_name: Optional[str] = None) -> np.ndarray:
+        return self.run_metadata('return_code', algo_name)
+
+_Python_modules: dict[Path,tuple[int,ModuleType]] = dict() # Python file -> (modification time in ns, module), see load_Python_module()
+
+def load_Python_module(filepath: Path, module_name: str = 'ext_module') -> ModuleType:
+    """
+    Import a Python file as a module, once per process.
+    The module is imported again only if the file was modified since.
+    """
+    mtime_ns = filepath.stat().st_mtime_ns
+    if filepath in _Python_modules and _Python_modules[filepath][0] == mtime_ns:
+        return _Python_modules[filepath][1]
+    # thanks wim https://stackoverflow.com/a/27189110
+    spec = importlib.util.spec_from_file_location(
+        name=module_name,
+        location=filepath,
+    )
+    assert(spec is not None)
+    ext_module = importlib.util.module_from_spec(spec)
+    assert(spec.loader is not None)
+    spec.loader.exec_module(ext_module)
+    _Python_modules[filepath] = (mtime_ns,ext_module)
+    return ext_module
+
+_data_folder_classes: dict[str,type[DataFolder]] = dict() # data folder type -> DataFolder subclass, see get_data_folder_class()
+
+def get_data_folder_class(data_folder_type: str) -> type[DataFolder]:
+    """
+    Return the DataFolder subclass dedicated to a data folder type, built on first call.
+    If the type has specific accessors (<type>.accessors.py), the public functions
+    defined in this module become methods of the subclass.
+    """
+    if data_folder_type in _data_folder_classes:
+        return _data_folder_classes[data_folder_type]
+    methods = dict()
+    accessors_definition_file: Path = Path(f'definitions/data_folder_types/{data_folder_type}.accessors.py')
+    if accessors_definition_file.exists():
+        ext_module = load_Python_module(accessors_definition_file,f"{data_folder_type}.accessors")
+        for name, value in vars(ext_module).items():
+            # ignore imported functions (from json import load...) and private ones
+            if callable(value) and not name.startswith('_') and getattr(value,'__module__',None) == ext_module.__name__:
+                log.debug(f"Adding {name}() as method of DataFolder for when type == '{data_folder_type}'")
+                methods[name] = value
+    # 'hex-mesh' -> HexMeshDataFolder
+    class_name = ''.join([word.capitalize() for word in data_folder_type.replace('-','_').split('_')]) + 'DataFolder'
+    _data_folder_classes[data_folder_type] = type(class_name, (DataFolder,), { '__slots__': (), **methods })
+    return _data_folder_classes[data_folder_type]
+
+def print_help_on_data_folder_type(data_folder_type: str):
+    definitions = get_definitions()
+    if data_folder_type not in definitions.data_folder_types:
+        log.fatal(f"{definitions.definitions_folder / 'data_folder_types' / (data_folder_type + '.yml')} does not exist")
+        exit(1)
+    YAML_content = definitions.data_folder_types[data_folder_type] # structure checked by DefinitionsRegistry.validate()
+    distinctive_content_filename_keywords = list(YAML_content['distinctive_content'])
+    print(f"A data folder is of type '{data_folder_type}' if it contains:")
+    print("\n  or\n".join([f" • {YAML_content['filenames'][x]} (={x})" for x in distinctive_content_filename_keywords]))
+    print("Other files that can be expected inside are:")
+    for filename_keyword, filename in YAML_content['filenames'].items():
+        if filename_keyword in distinctive_content_filename_keywords:
+            continue # already printed
+        print(f" • {filename} (={filename_keyword})")
+    default_view = get_default_view_name(data_folder_type)
+    print(f"Views declared for this type of data folders:")
+    for view_name in get_declared_views(data_folder_type):
+        print(f" • {view_name}" + (" (default view)" if view_name == default_view else ""))
+        # print the view description
+        view_definition = definitions.views[data_folder_type][view_name]
+        if 'description' in view_definition:
+            print(f"   {view_definition['description']}",end='') # there is already a new line at the end of the description
+
+def print_help_on_algorithm(algo_name: str):
+    """
+    Print underlying executable, input/output files and other arguments for an algorithm defined with a YAML file (not a Python script)
+    """
+    from rich.console import Console
+    from rich.rule import Rule
+    from rich.theme import Theme
+    definitions = get_definitions()
+    YAML_filepath: Path = definitions.definitions_folder / 'algorithms' / (algo_name + '.yml')
+    if algo_name not in definitions.algorithms:
+        log.fatal(f'{YAML_filepath} does not exist')
+        exit(1)
+    print(f"Algorithm '{algo_name}'")
+    print(f"Has a pre-processing stage: {'pre' in definitions.hooks[algo_name]}")
+    print(f"Has a post-processing stage: {'post' in definitions.hooks[algo_name]}")
+    if 'description' in definitions.algorithms[algo_name]:
+        print(f"Description: {definitions.algorithms[algo_name]['description']}")
+    # structure of each per-type specification was checked by DefinitionsRegistry.validate()
+    for input_folder_type, algo_spec in definitions.algorithm_specs[algo_name].items():
+        console = Console(theme=Theme(inherit=False))
+        console.print(Rule(f"Behavior when run on a data folder of type '{input_folder_type}'"))
+        # starts with input files
+        # we can display 4 pieces of information:
+        # - the filename keyword (by convention in uppercase)
+        # - the filename (name.ext)
+        # - the data folder type in which this file is expected (the algo will search in the closest parent folder)
+        # - the command line keyword ({name}) -> not useful for the end user
+        all_command_line_keywords = dict()
+        console.print("Input files:")
+        for command_line_keyword, filename_keyword in algo_spec['arguments']['input_files'].items():
+            filename, affiliated_data_folder_type = translate_filename_keyword(filename_keyword)
+            console.print(f" • {filename} (={filename_keyword}), in closest parent folder of type '{affiliated_data_folder_type}'")
+            all_command_line_keywords[command_line_keyword] = filename
+        if 'others' in algo_spec['arguments']:
+            console.print("Other inputs (not files):")
+            for command_line_keyword, other_argument in algo_spec['arguments']['others'].items():
+                if 'default' in other_argument:
+                    default_value = other_argument['default']
+                    console.print(f" • {command_line_keyword} (type {type(default_value).__name__}, default value = {default_value}) : {other_argument.get('description','')}")
+                else: # 'adjacent_file'
+                    console.print(f" • {command_line_keyword} (file {other_argument['adjacent_file']}, next to {YAML_filepath.name})")
+                all_command_line_keywords[command_line_keyword] = '{' + command_line_keyword + '}'
+        output_folder = None
+        if 'output_folder' in algo_spec:
+            output_folder = algo_spec['output_folder']
+        if 'output_files' in algo_spec['arguments']:
+            console.print("Output files:" if output_folder is None else f"Output files (in a '{output_folder}' subfolder):")
+            for command_line_keyword, filename_keyword in algo_spec['arguments']['output_files'].items():
+                filename, _ = translate_filename_keyword(filename_keyword) # TODO check consistency across all affiliated data folder types?
+                console.print(f" • {filename} (={filename_keyword})")
+                all_command_line_keywords[command_line_keyword] = filename
+        elif output_folder is not None:
+            console.print(f"Output files: in a '{output_folder}' subfolder")
+            all_command_line_keywords['output_folder'] = output_folder
+        # retrieve info about underlying executable
+        console.print(f"Executable: {get_executable(algo_spec['executable'],YAML_filepath).path}")
+        command_line: str = algo_spec['executable']['command_line']
+        command_line = command_line.format(**all_command_line_keywords)
+        console.print(f"Command line: {command_line}")
+
+# names exported by `from dds import *` : public names of this module, except the lazily imported ones (see LAZY_IMPORTS)
+__all__ = [name for name in list(globals()) if not name.startswith('_') and name not in ['annotations','TYPE_CHECKING']]
+
+FAST_ACTIONS: list[str] = ['typeof','history'] # actions without options, whose command line is not parsed with argparse, see main()
+
+def parse_command_line():
+    """
+    Parse sys.argv with argparse
+    """
+    from argparse import ArgumentParser
+    
+    parser = ArgumentParser(
+        prog='dds',
+        description='Semantic data folders'
+    )
+    
+    parser.add_argument(
+        'action',
+        choices = ['typeof', 'run', 'run-many', 'view', 'history','children','find','index','watch','migrate','cache','help']
+    )
+    
+    parser.add_argument(
+        'supp_args',
+        nargs='*'
+    )
+
+    parser.add_argument(
+        '--format',
+        choices = CHILDREN_FORMATS,
+        default = 'tree',
+        help = 'output format of `children`'
+    )
+
+    parser.add_argument(
+        '--max-depth',
+        type = int,
+        help = 'maximal depth of `children`, 1 for the direct subfolders'
+    )
+
+    parser.add_argument(
+        '--query',
+        help = 'with `run-many`, criteria of `find` selecting the data folders below the given root folder, like "type=tet-mesh algo=Gmsh"'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type = int,
+        help = 'with `run-many`, number of CPU slots shared by the jobs, according to the threads they declare. Default: number of CPUs'
+    )
+
+    parser.add_argument(
+        '--memory-gb',
+        type = float,
+        help = 'with `run-many`, memory shared by the jobs, according to the memory they declare. Default: memory of the machine'
+    )
+
+    parser.add_argument(
+        '--timeout',
+        type = float,
+        help = 'with `run` and `run-many`, seconds after which the command is killed, instead of the timeout of the algorithm. 0 for no timeout'
+    )
+
+    return parser.parse_args()
+
+def main():
+    """
+    Command line interface, see dds.py
+    """
+
+    if len(sys.argv) >= 2 and sys.argv[1] in FAST_ACTIONS and not any([arg.startswith('-') for arg in sys.argv[2:]]):
+        # no option to parse: skip argparse, which imports gettext, locale and shutil (see benchmarks/startup.py)
+        args = SimpleNamespace(action=sys.argv[1], supp_args=sys.argv[2:])
+    else:
+        args = parse_command_line()
+
+    if args.action == 'typeof':
+        assert(len(args.supp_args)==1)
+        path = Path(args.supp_args[0])
+        assert(path.exists())
+        sys.stdout.write(f'{type_inference(path)}\n') # no need to import rich
+        exit(0)
+    if args.action == 'run':
+        assert(len(args.supp_args)>=2)
+        algo = args.supp_args[0]
+        path = Path(args.supp_args[1])
+        assert(path.exists())
+        info_entry = run(path,algo,args.supp_args[2:],timeout=args.timeout)
+        # failure if the command was killed after its timeout, or returned an error
+        exit(1 if info_entry.get('status',None) == 'timeout' or info_entry['return_code'] != 0 else 0)
+    if args.action == 'run-many':
+        # ./dds.py run-many algo folder1 folder2... [arg=value...]
+        # ./dds.py run-many algo root_folder --query "criteria" [arg=value...]
+        assert(len(args.supp_args)>=2)
+        algo = args.supp_args[0]
+        paths = [Path(supp_arg) for supp_arg in args.supp_args[1:] if '=' not in supp_arg or Path(supp_arg).exists()]
+        algo_arguments = [supp_arg for supp_arg in args.supp_args[1:] if '=' in supp_arg and not Path(supp_arg).exists()]
+        for path in paths:
+            assert(path.exists())
+        if args.query is not None:
+            assert(len(paths)==1)
+            paths = find_data_folders(paths[0],args.query.split())
+        results = run_many(algo,paths,algo_arguments,args.jobs,args.memory_gb,progress=True,timeout=args.timeout)
+        print_run_many_summary(results)
+        exit(0 if all([result.status == 'done' for result in results]) else 1)
+    if args.action == 'view':
+        assert(len(args.supp_args) in [1,2])
+        path = Path(args.supp_args[0])
+        assert(path.exists())
+        if len(args.supp_args) == 2:
+            view_name = args.supp_args[1]
+            DataFolder(path).view(view_name)
+        else:
+            # use default view
+            DataFolder(path).view()
+        exit(0)
+    if args.action == 'history':
+        assert(len(args.supp_args)==1)
+        path = Path(args.supp_args[0])
+        assert(path.exists())
+        DataFolder(path).print_history()
+        exit(0)
+    if args.action == 'children':
+        assert(len(args.supp_args)==1)
+        path = Path(args.supp_args[0])
+        assert(path.exists())
+        try:
+            if args.format == 'tree':
+                print_children(path,recursive=True,max_depth=args.max_depth)
+            else:
+                stream_children(path,args.format,max_depth=args.max_depth)
+        except BrokenPipeError: # output piped into a command that exited, like `head`
+            sys.stderr.close()
+        exit(0)
+    if args.action == 'find':
+        assert(len(args.supp_args)>=1)
+        path = Path(args.supp_args[0])
+        assert(path.exists())
+        for data_folder_path in find_data_folders(path,args.supp_args[1:]):
+            sys.stdout.write(f'{data_folder_path}\n')
+        exit(0)
+    if args.action == 'index':
+        assert(len(args.supp_args)==1)
+        path = Path(args.supp_args[0])
+        assert(path.exists())
+        chrono_start = time.monotonic()
+        nb_visited, nb_indexed = get_dataset_index().refresh(path)
+        print(f'{nb_visited} folders visited, {nb_indexed} (re-)indexed in {simple_human_readable_duration(time.monotonic() - chrono_start)} -> {collapseuser(DATASET_INDEX_FILE)}')
+        exit(0)
+    if args.action == 'watch':
+        assert(len(args.supp_args)==1)
+        path = Path(args.supp_args[0])
+        assert(path.exists())
+        try:
+            DatasetWatcher(path).watch()
+        except KeyboardInterrupt:
+            exit(0)
+    if args.action == 'migrate':
+        assert(len(args.supp_args)==1)
+        path = Path(args.supp_args[0])
+        assert(path.exists())
+        nb_files, nb_keys = migrate_info_files(path)
+        print(f'{nb_keys} run identifiers converted in {nb_files} info.json files')
+        exit(0)
+    if args.action == 'cache':
+        assert(len(args.supp_args)==1)
+        if args.supp_args[0] == 'rebuild':
+            rebuild_definitions_cache()
+            print(f'{collapseuser(DEFINITIONS_CACHE_FILE)} rebuilt')
+        elif args.supp_args[0] == 'stats':
+            print_definitions_cache_stats()
+        else:
+            log.error(f"Unknown cache action '{args.supp_args[0]}', expecting 'rebuild' or 'stats'")
+            exit(1)
+        exit(0)
+    if args.action == 'help':
+        from rich.console import Console, group, Group
+        from rich.text import Text
+        from rich.theme import Theme
+        from rich.panel import Panel
+        assert(len(args.supp_args)<=1)
+        console = Console(theme=Theme(inherit=False))
+        if len(args.supp_args)==1:
+            if args.supp_args[0] in get_declared_data_folder_types():
+                print_help_on_data_folder_type(args.supp_args[0])
+            elif args.supp_args[0] in get_declared_algorithms_as_YAML():
+                print_help_on_algorithm(args.supp_args[0])
+            elif args.supp_args[0] in get_declared_algorithms_as_Python_script():
+                print(f"{args.supp_args[0]} is an algorithm defined as a Python script")
+            else:
+                # TODO check path keywords
+                # If args.supp_args[0] is a path keyword, list all algorithms & views that depend on this path
+                pass
+            exit(0)
+        # else: general help
+
+        @group()
+        def get_typeof_panel_content():
+            yield Text.from_markup("""\
+dds.py [r]typeof[/] [cyan]path/to/input/folder[/]
+
+    Infer the type of a [cyan]data folder[/].
+    Here are the types found in [bright_black]definitions/data_folder_types/[/] :\
+            """)
+            for data_folder_type in get_declared_data_folder_types():
+                yield Text(f'     • {data_folder_type}') # TODO list available views
+        
+        @group()
+        def get_run_panel_content():
+            yield Text.from_markup("""\
+dds.py [r]run[/] [bright_green]algo_name[/] [cyan]path/to/input/folder[/] \[algo-specific args]
+
+    Run the specified [bright_green]algorithm[/] on a [cyan]data folder[/]
+    Here are the algorithms found in [bright_black]definitions/algorithms/[/] :\
+            """)
+            for algo in get_declared_algorithms_as_YAML():
+                yield Text(f'     • {algo}')
+            for algo in get_declared_algorithms_as_Python_script():
+                yield Text.from_markup(f'     • {algo} [yellow](Python script)[/]')
+
+        help_panels = Group(
+            Text.from_markup("""\
+     _     _ 
+    | |   | |
+  __| | __| |___ 
+ / _` |/ _` / __|
+| (_| | (_| \\__ \\
+ \\__,_|\\__,_|___/
+
+Semantic data folders
+
+dds.py <action> \[action-specific args]
+            """), # ASCII font from https://patorjk.com/software/taag/#p=display&f=Doom&t=Type%20Something%20
+            Panel(get_typeof_panel_content()),
+            Panel(get_run_panel_content()),
+            Panel(Text.from_markup("""\
+dds.py [r]run-many[/] [bright_green]algo_name[/] [cyan]path/to/input/folder[/]... \[algo-specific args] [bright_black]\[--jobs N] \[--memory-gb N] \[--timeout S][/]
+dds.py [r]run-many[/] [bright_green]algo_name[/] [cyan]path/to/root/folder[/] [bright_black]--query "criteria"[/] \[algo-specific args] [bright_black]\[--jobs N] \[--memory-gb N] \[--timeout S][/]
+
+    Run the specified [bright_green]algorithm[/] on several [cyan]data folders[/] in parallel, and print a summary of the runs.
+    With [bright_black]--query[/], run it on the folders below a [cyan]root folder[/] matching all [bright_black]criteria[/] (same as [r]find[/]).
+    Jobs are started as long as the threads and memory they declare fit in [bright_black]--jobs[/] CPU slots (default: number of CPUs)
+    and [bright_black]--memory-gb[/] (default: memory of the machine).
+    [bright_black]--timeout[/] overrides the timeout of the algorithm, in seconds (0 for no timeout).
+    Exit with 1 if a run failed or timed out.\
+            """)),
+            Panel(Text.from_markup("""\
+dds.py [r]view[/] [cyan]path/to/input/folder[/] \[[bright_green]view_name[/]]
+
+    Visualize a [cyan]data folder[/] with the default view, or with the [bright_green]specified view[/].\
+            """)),
+            Panel(Text.from_markup("""\
+dds.py [r]history[/] [cyan]path/to/input/folder[/]
+
+    Print the history of algorithms run on a [cyan]data folder[/]\
+            """)),
+            Panel(Text.from_markup("""\
+dds.py [r]children[/] [cyan]path/to/input/folder[/] [bright_black]\[--format tree|ndjson|tsv] \[--max-depth N][/]
+
+    Print the children tree of a [cyan]folder[/], with the type of each of them.
+    With [bright_black]--format ndjson[/] or [bright_black]tsv[/], print one record (path, type, generative algorithm) per folder as soon as it is found.\
+            """)),
+            Panel(Text.from_markup("""\
+dds.py [r]find[/] [cyan]path/to/root/folder[/] [bright_black]criteria[/]
+
+    Print the folders below a [cyan]root folder[/] matching all [bright_black]criteria[/], from the index.
+    Criteria are [bright_black]field=value[/] (or != < <= > >=), the field being
+    [bright_black]type[/], [bright_black]algo[/] (generative algorithm), [bright_black]run[/] (executed algorithm), [bright_black]return_code[/], [bright_black]duration[/], [bright_black]param.<name>[/]
+    or the end of a value in a stats file, like [bright_black]turning-points.nb>0[/] or [bright_black]hex_SJ.min<0[/].\
+            """)),
+            Panel(Text.from_markup("""\
+dds.py [r]index[/] [cyan]path/to/root/folder[/]
+
+    Index all folders below a [cyan]root folder[/] (type, info.json, stats) in [bright_black].cache/index.sqlite[/].
+    Next calls only re-read the folders modified since.\
+            """)),
+            Panel(Text.from_markup("""\
+dds.py [r]watch[/] [cyan]path/to/root/folder[/]
+
+    Keep the index of a [cyan]root folder[/] up to date (Linux only), as new folders, [bright_black]info.json[/] and stats files appear.\
+            """)),
+            Panel(Text.from_markup("""\
+dds.py [r]migrate[/] [cyan]path/to/root/folder[/]
+
+    Convert the keys of the [bright_black]info.json[/] files below a [cyan]root folder[/] to microsecond-resolution run identifiers.
+    Old keys remain readable, this is only needed for uniform keys.\
+            """)),
+            Panel(Text.from_markup("""\
+dds.py [r]cache[/] rebuild|stats
+
+    [bright_green]rebuild[/] : parse [bright_black]definitions/[/] and overwrite the cache of parsed definitions.
+    [bright_green]stats[/] : print info about this cache.
+    The cache is automatically rebuilt when a file in [bright_black]definitions/[/] changes.\
+            """)),
+            Panel(Text.from_markup("""\
+dds.py [r]help[/] \[[bright_green]name[/]]
+
+    Print this message.
+    If a [bright_green]name[/] is provided, parse defined data folder types.
+    If one of them has this name, print info about it.
+    Else, parse defined algorithms.
+    If one of them has this name, print info about it.\
+            """))
+        )
+        console.print(help_panels)
+        exit(0)
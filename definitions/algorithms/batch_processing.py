@@ -51,6 +51,8 @@
 # but we should leave the user free to rename all folders,
 # TODO use DataFolder.get_subfolders_generated_by() and check parameters value in the info.json
 
+from rich.console import Console
+from rich.theme import Theme
 from rich.prompt import Confirm
 import subprocess
 from shutil import move, rmtree
@@ -2,6 +2,7 @@
 
 # Compare two data folders of the same type
 
+from rich.console import Console
 from rich.table import Table
 
 from dds import *
@@ -2,6 +2,8 @@
 
 # pre-processing for evocube.yml
 
+from typing import Optional
+
 # own module
 from dds import *
 
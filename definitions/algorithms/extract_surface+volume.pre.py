@@ -4,6 +4,8 @@
 # ensure there is not already a SURFACE_MESH_OBJ and a SURFACE_MAP_TXT in the `input_subfolder`
 # `extract_surface` and `extract_surface+volume` should not be both run on a same data folder
 
+from typing import Optional
+
 # own module
 from dds import *
 
@@ -9,6 +9,7 @@ import copy
 from string import Template
 from urllib import request
 from collections import defaultdict
+from typing import Optional
 
 from dds import *
 
@@ -181,9 +182,6 @@ def main(input_folder: Path, arguments: list):
             graphcut_row['similarity'] = labeling_object.compute_labeling_similarity_with(Ours_labeling)*100 # type: ignore | see ../data_folder_types/labeling.accessors.py
             
             # copy the labeling as glTF
-            if not Ours_labeling.get_file('POLYCUBE_SURFACE_MESH_OBJ',must_exist=False).exists():
-                # help the next .get_file() because the depth of missing files is > 1
-                Ours_labeling.run('fastbndpolycube',silent_output=False)
             glb_labeling_file: Path = Ours_labeling.get_file('POLYCUBE_LABELING_MESH_ANIM_GLB',must_exist=True,silent_output=False)
             glb_labeling_filename = CAD_name + '_labeling_ours.glb'
             copyfile(glb_labeling_file, output_folder / 'glb' / glb_labeling_filename)
@@ -287,9 +285,6 @@ def main(input_folder: Path, arguments: list):
             evocube_row['percentage_preserved']     = None if total_feature_edges == 0 else labeling_stats['feature-edges']['preserved']/total_feature_edges*100
 
             # copy the labeling as glTF
-            if not labeling_object.get_file('POLYCUBE_SURFACE_MESH_OBJ',must_exist=False).exists():
-                # help the next .get_file() because the depth of missing files is > 1
-                labeling_object.run('fastbndpolycube',silent_output=False)
             glb_labeling_file: Path = labeling_object.get_file('POLYCUBE_LABELING_MESH_ANIM_GLB',must_exist=True,silent_output=False)
             glb_labeling_filename = CAD_name + '_labeling_evocube.glb'
             copyfile(glb_labeling_file, output_folder / 'glb' / glb_labeling_filename)
@@ -361,9 +356,6 @@ def main(input_folder: Path, arguments: list):
 
             # copy the labeling as glTF
             if tet_mesh_object.get_file('SURFACE_MESH_OBJ',must_exist=False,silent_output=False).exists():
-                if not labeling_object.get_file('POLYCUBE_SURFACE_MESH_OBJ',must_exist=False,silent_output=False).exists():
-                    # help the next .get_file() because the depth of missing files is > 1
-                    labeling_object.run('fastbndpolycube',silent_output=False)
                 glb_labeling_file: Path = labeling_object.get_file('POLYCUBE_LABELING_MESH_ANIM_GLB',must_exist=True,silent_output=False)
                 glb_labeling_filename = CAD_name + '_labeling_polycut.glb'
                 copyfile(glb_labeling_file, output_folder / 'glb' / glb_labeling_filename)
@@ -2,6 +2,8 @@
 
 from collections import defaultdict
 from shutil import rmtree
+from rich.console import Console
+from rich.table import Table
 from rich.prompt import Confirm
 
 from dds import *
@@ -10,6 +10,8 @@ from dds import *
 from shutil import unpack_archive, copyfile, rmtree
 from tempfile import mkdtemp
 from urllib import request
+from rich.console import Console
+from rich.theme import Theme
 from rich.prompt import Confirm
 import meshio
 
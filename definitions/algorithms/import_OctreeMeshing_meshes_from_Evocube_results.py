@@ -13,6 +13,7 @@
 
 from dds import *
 from shutil import copyfile
+from rich.console import Console
 
 def main(output_path: Path, arguments: list):
     # check `arguments`
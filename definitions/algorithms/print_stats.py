@@ -5,6 +5,7 @@
 # 'labeling' -> labeling stats (charts, boundaries, etc)
 # 'hex-mesh' -> hexahedral mesh stats (vertices, facets, etc)
 
+from rich.console import Console
 from rich.table import Table
 
 from dds import *
@@ -3,6 +3,8 @@
 # This script exists to ensure the data is evolving alongside what the code expects (filenames, structure, file format...)
 
 from shutil import move
+from rich.console import Console
+from rich.theme import Theme
 
 from dds import *
 
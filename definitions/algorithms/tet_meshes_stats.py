@@ -4,6 +4,10 @@
 # as well as `input_folder` / 'OctreeMeshing' / 'cad' / <'tet-mesh' data folders>
 # and print min & max number of tetrahedra
 
+from typing import Optional
+from rich.console import Console
+from rich.theme import Theme
+
 from dds import *
 
 GMSH_OUPUT_FOLDER_NAME = 'Gmsh_0.15' # 'Gmsh_0.1' or 'Gmsh_0.15'
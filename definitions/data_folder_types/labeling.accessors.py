@@ -5,7 +5,7 @@
 from json import load
 
 # own module
-from dds import DataFolder, log
+from dds import DataFolder
 
 def get_labeling_stats_dict(self: DataFolder, silent_output: bool = False) -> dict:
     assert(self.type == 'labeling')
@@ -44,13 +44,3 @@ def compute_labeling_similarity_with(self: DataFolder, comparand: DataFolder) ->
             line_counter += 1
     assert(line_counter == nb_labels) # else the comparand has less lines than self
     return float(same_label_counter) / float(nb_labels)
-
-# add these functions to the class, as methods
-log.info(f"Adding get_labeling_stats_dict() as DataFolder method for when type == 'labeling'")
-DataFolder.get_labeling_stats_dict = get_labeling_stats_dict # type: ignore
-log.info(f"Adding has_valid_labeling() as DataFolder method for when type == 'labeling'")
-DataFolder.has_valid_labeling = has_valid_labeling # type: ignore
-log.info(f"Adding nb_turning_points() as DataFolder method for when type == 'labeling'")
-DataFolder.nb_turning_points = nb_turning_points # type: ignore
-log.info(f"Adding compute_labeling_similarity_with() as DataFolder method for when type == 'labeling'")
-DataFolder.compute_labeling_similarity_with = compute_labeling_similarity_with # type: ignore
\ No newline at end of file